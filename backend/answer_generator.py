@@ -1,12 +1,92 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+from collections import deque
+from typing import AsyncIterator, Dict, List, Optional, Any
 import os
-import requests
 import json
-from groq import Groq
+import httpx
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 logger = logging.getLogger(__name__)
 
+# Questions packed into one marshaled call; past ~8 the longer output
+# outweighs the saved round-trips
+MARSHAL_MAX_QUESTIONS = int(os.getenv("LLM_MARSHAL_MAX_QUESTIONS", "6"))
+MARSHAL_WINDOW_SECONDS = float(os.getenv("LLM_MARSHAL_WINDOW_MS", "150")) / 1000
+
+# Groq is only abandoned for Ollama when more than this share of the
+# recent calls failed (after retries), not on a single bad request
+GROQ_FAILURE_WINDOW = 20
+GROQ_FAILURE_MIN_SAMPLES = 5
+GROQ_FAILURE_RATE_THRESHOLD = 0.5
+
+# Shared Groq budget across all sessions: a token bucket matching the account
+# rate limit plus a cap on in-flight requests, so bursts queue instead of 429ing
+_GROQ_LIMITER = AsyncLimiter(max_rate=float(os.getenv("GROQ_MAX_QPS", "30")), time_period=1)
+_GROQ_CONCURRENCY = asyncio.Semaphore(int(os.getenv("GROQ_MAX_CONCURRENCY", "16")))
+
+# Shared keep-alive pools reused across all sessions so each answer
+# doesn't pay a fresh TCP/TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_ollama_client = httpx.AsyncClient(timeout=30, limits=_HTTP_LIMITS)
+_groq_http_client = httpx.AsyncClient(http2=True, timeout=30, limits=_HTTP_LIMITS)
+
+# System prompts per question type, built once at import
+_BASE_SYSTEM_PROMPT = "You are an interview candidate responding to questions. "
+_SYSTEM_PROMPTS = {
+    "behavioral": _BASE_SYSTEM_PROMPT + """Use the STAR format (Situation, Task, Action, Result) 
+to structure your answer. Be specific and concise.""",
+    "technical": _BASE_SYSTEM_PROMPT + """Demonstrate technical depth with specific examples from your experience. 
+Mention technologies, tools, and measurable outcomes.""",
+    "general": _BASE_SYSTEM_PROMPT + """Answer clearly and confidently, backing up claims with 
+specific examples from your experience.""",
+}
+
+# User prompt templates, rendered with str.format_map
+_USER_PROMPT_TEMPLATE = """
+QUESTION: {question}
+
+YOUR BACKGROUND:
+{resume_context}
+
+JOB REQUIREMENTS:
+{jd_context}
+{previous_qa_context}
+
+Provide a concise, personalized answer (2-3 sentences max) that:
+1. Directly addresses the question
+2. References YOUR specific experience from the background
+3. Aligns with the job requirements
+4. Sounds natural and confident
+
+Answer:"""
+
+_MARSHALED_PROMPT_TEMPLATE = """
+QUESTIONS:
+{questions}
+
+YOUR BACKGROUND:
+{resume_context}
+
+JOB REQUIREMENTS:
+{jd_context}
+{previous_qa_context}
+
+For EACH question, provide a concise, personalized answer (2-3 sentences max).
+Use the STAR format for behavioral questions and concrete technologies for technical ones.
+
+Respond with JSON only, in the form:
+{{"answers": [{{"q": 1, "a": "..."}}, {{"q": 2, "a": "..."}}]}}"""
+
+def _is_transient_groq_error(exc: BaseException) -> bool:
+    """Connection drops and rate limits are worth retrying; other API errors aren't"""
+    try:
+        from groq import APIConnectionError, RateLimitError
+    except ImportError:
+        return False
+    return isinstance(exc, (APIConnectionError, RateLimitError))
+
 class AnswerGenerator:
     """Generates personalized interview answers using Groq/Ollama + RAG context"""
     
@@ -20,7 +100,9 @@ class AnswerGenerator:
         """
         self.use_ollama = use_ollama
         self.ollama_url = os.getenv("OLLAMA_URL", "http://localhost:11434")
+        self.ollama_model = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
         self.groq_client = None
+        self._recent_groq_results = deque(maxlen=GROQ_FAILURE_WINDOW)
         
         if not use_ollama:
             # Use Groq API (free, fast)
@@ -30,7 +112,12 @@ class AnswerGenerator:
                 self.use_ollama = True
             else:
                 try:
-                    self.groq_client = Groq(api_key=self.api_key)
+                    # Imported here so Ollama-only deployments never load the SDK
+                    from groq import AsyncGroq
+                    self.groq_client = AsyncGroq(
+                        api_key=self.api_key,
+                        http_client=_groq_http_client
+                    )
                     self.model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
                     logger.info(f"Using Groq API with model: {self.model}")
                 except Exception as e:
@@ -39,19 +126,20 @@ class AnswerGenerator:
         
         if self.use_ollama:
             # Use local Ollama
-            self.model = os.getenv("OLLAMA_MODEL", "llama3.2:3b")
+            self.model = self.ollama_model
             logger.info(f"Using Ollama with model: {self.model}")
         
         self.temperature = float(os.getenv("LLM_TEMPERATURE", "0.7"))
         self.max_tokens = int(os.getenv("LLM_MAX_TOKENS", "300"))
     
-    def generate_answer(
+    async def generate_answer(
         self,
         question: str,
         resume_data: Dict,
         jd_data: Dict,
         question_type: str = "general",
-        previous_context: Optional[List[Dict]] = None
+        previous_context: Optional[List[Dict]] = None,
+        precomputed_ctx: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate personalized answer based on question and context
@@ -62,134 +150,452 @@ class AnswerGenerator:
             jd_data: Job description data
             question_type: 'technical', 'behavioral', or 'general'
             previous_context: Previous Q&A from follow-up interviews
+            precomputed_ctx: Session context from build_context (skips re-extraction)
             
         Returns:
             Dict with answer, confidence, and context_used
         """
         try:
-            # Extract relevant context from resume
-            resume_context = self._extract_resume_context(resume_data, question)
+            prompt = self._build_prompts(
+                question, resume_data, jd_data, question_type, previous_context,
+                precomputed_ctx
+            )
             
-            # Extract relevant context from job description
-            jd_context = self._extract_jd_context(jd_data, question)
+            # Call LLM (Groq or Ollama)
+            answer_text = await self._call_llm(prompt["system"], prompt["user"])
             
-            # Build previous Q&A context for follow-up interviews
-            previous_qa_context = ""
-            if previous_context and len(previous_context) > 0:
-                previous_qa_context = "\n\nPREVIOUS INTERVIEW CONTEXT:\n"
-                for qa in previous_context[-3:]:  # Last 3 Q&As
-                    previous_qa_context += f"Q: {qa.get('question', '')}\nA: {qa.get('answer', '')}\n\n"
+            return self._build_result(answer_text, prompt)
             
-            # Build system prompt based on question type
-            system_prompt = self._build_system_prompt(question_type)
+        except Exception as e:
+            logger.error(f"Error generating answer: {e}")
+            return self._fallback_result()
+    
+    async def generate_answer_stream(
+        self,
+        question: str,
+        resume_data: Dict,
+        jd_data: Dict,
+        question_type: str = "general",
+        previous_context: Optional[List[Dict]] = None,
+        precomputed_ctx: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a personalized answer as it is generated
+        
+        Takes the same arguments as generate_answer.
+        
+        Yields:
+            {"delta": str} for each generated chunk, then a final
+            {"result": Dict} with answer, confidence, and context_used
+        """
+        parts: List[str] = []
+        try:
+            prompt = self._build_prompts(
+                question, resume_data, jd_data, question_type, previous_context,
+                precomputed_ctx
+            )
             
-            # Build user prompt with context
-            user_prompt = f"""
-QUESTION: {question}
-
-YOUR BACKGROUND:
-{resume_context}
-
-JOB REQUIREMENTS:
-{jd_context}
-{previous_qa_context}
-
-Provide a concise, personalized answer (2-3 sentences max) that:
-1. Directly addresses the question
-2. References YOUR specific experience from the background
-3. Aligns with the job requirements
-4. Sounds natural and confident
-
-Answer:"""
-
-            # Call LLM (Groq or Ollama)
-            answer_text = self._call_llm(system_prompt, user_prompt)
+            async for delta in self._stream_llm(prompt["system"], prompt["user"]):
+                parts.append(delta)
+                yield {"delta": delta}
             
-            # Calculate confidence based on context match
-            confidence = self._calculate_confidence(
-                question, answer_text, resume_context, jd_context
-            )
+            result = self._build_result("".join(parts), prompt)
             
-            return {
-                "answer": answer_text.strip(),
-                "confidence": confidence,
-                "context_used": {
-                    "resume_section": self._get_context_sections(resume_context),
-                    "jd_section": self._get_context_sections(jd_context)
-                }
+        except Exception as e:
+            logger.error(f"Error streaming answer: {e}")
+            result = self._fallback_result()
+        
+        yield {"result": result}
+    
+    async def generate_answers_batch(
+        self,
+        items: List[Dict],
+        resume_data: Dict,
+        jd_data: Dict,
+        previous_context: Optional[List[Dict]] = None,
+        precomputed_ctx: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate answers for several questions concurrently
+        
+        Args:
+            items: List of dicts with 'question' and optional 'type'
+            resume_data: Parsed resume data
+            jd_data: Job description data
+            previous_context: Previous Q&A from follow-up interviews
+            precomputed_ctx: Session context from build_context
+            
+        Returns:
+            List of answer dicts in the same order as items
+        """
+        if precomputed_ctx is None:
+            precomputed_ctx = self.build_context(resume_data, jd_data)
+        
+        prompts = [
+            self._build_prompts(
+                item["question"],
+                resume_data,
+                jd_data,
+                item.get("type") or "general",
+                previous_context,
+                precomputed_ctx
+            )
+            for item in items
+        ]
+        
+        answers = await asyncio.gather(
+            *[self._call_llm(p["system"], p["user"]) for p in prompts],
+            return_exceptions=True
+        )
+        
+        results = []
+        for item, prompt, answer_text in zip(items, prompts, answers):
+            if isinstance(answer_text, Exception):
+                logger.error(f"Error generating answer: {answer_text}")
+                results.append(self._fallback_result())
+            else:
+                results.append(self._build_result(answer_text, prompt))
+        return results
+    
+    def _build_prompts(
+        self,
+        question: str,
+        resume_data: Dict,
+        jd_data: Dict,
+        question_type: str,
+        previous_context: Optional[List[Dict]],
+        precomputed_ctx: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build system/user prompts and the context they were built from"""
+        # Extract relevant context from resume and job description
+        ctx = precomputed_ctx or self.build_context(resume_data, jd_data)
+        resume_context = ctx["resume"]
+        jd_context = ctx["jd"]
+        
+        # Build system prompt based on question type
+        system_prompt = self._build_system_prompt(question_type)
+        
+        # Build user prompt with context
+        user_prompt = _USER_PROMPT_TEMPLATE.format_map({
+            "question": question,
+            "resume_context": resume_context,
+            "jd_context": jd_context,
+            "previous_qa_context": self._format_previous_context(previous_context)
+        })
+        
+        return {
+            "system": system_prompt,
+            "user": user_prompt,
+            "resume_context": resume_context,
+            "jd_context": jd_context,
+            "context_tokens": ctx["tokens"]
+        }
+    
+    def _build_result(self, answer_text: str, prompt: Dict[str, Any]) -> Dict[str, Any]:
+        """Package LLM output with confidence and context metadata"""
+        resume_context = prompt["resume_context"]
+        jd_context = prompt["jd_context"]
+        
+        # Calculate confidence based on context match
+        confidence = self._calculate_confidence(answer_text, prompt["context_tokens"])
+        
+        return {
+            "answer": answer_text.strip(),
+            "confidence": confidence,
+            "context_used": {
+                "resume_section": self._get_context_sections(resume_context),
+                "jd_section": self._get_context_sections(jd_context)
             }
+        }
+    
+    def _fallback_result(self) -> Dict[str, Any]:
+        """Generic answer returned when generation fails"""
+        return {
+            "answer": "I have relevant experience with this. Let me elaborate...",
+            "confidence": 0.5,
+            "context_used": {}
+        }
+    
+    async def generate_answers_marshaled(
+        self,
+        questions: List[str],
+        resume_data: Dict,
+        jd_data: Dict,
+        question_types: Optional[List[str]] = None,
+        previous_context: Optional[List[Dict]] = None,
+        precomputed_ctx: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Answer several questions with a single LLM call
+        
+        Questions are packed into one prompt and the model is asked for a
+        JSON object with one answer per question. Falls back to one call per
+        question if the response can't be parsed.
+        
+        Args:
+            questions: Interview questions (keep to MARSHAL_MAX_QUESTIONS or fewer)
+            resume_data: Parsed resume data
+            jd_data: Job description data
+            question_types: Optional type per question
+            previous_context: Previous Q&A from follow-up interviews
+            precomputed_ctx: Session context from build_context
+            
+        Returns:
+            List of answer dicts in the same order as questions
+        """
+        types = question_types or ["general"] * len(questions)
+        if len(questions) == 1:
+            return [await self.generate_answer(
+                questions[0], resume_data, jd_data, types[0], previous_context,
+                precomputed_ctx
+            )]
+        
+        if precomputed_ctx is None:
+            precomputed_ctx = self.build_context(resume_data, jd_data)
+        
+        prompt = {
+            "system": self._build_system_prompt("general"),
+            "resume_context": precomputed_ctx["resume"],
+            "jd_context": precomputed_ctx["jd"],
+            "context_tokens": precomputed_ctx["tokens"]
+        }
+
+        numbered = "\n".join(
+            f"{i}. [{q_type or 'general'}] {q}"
+            for i, (q, q_type) in enumerate(zip(questions, types), 1)
+        )
+        user_prompt = _MARSHALED_PROMPT_TEMPLATE.format_map({
+            "questions": numbered,
+            "resume_context": prompt["resume_context"],
+            "jd_context": prompt["jd_context"],
+            "previous_qa_context": self._format_previous_context(previous_context)
+        })
+        
+        try:
+            raw = await self._call_llm(
+                prompt["system"],
+                user_prompt,
+                json_mode=True,
+                max_tokens=self.max_tokens * len(questions)
+            )
+            answers = json.loads(raw)["answers"]
+            by_index = {int(entry["q"]): str(entry["a"]) for entry in answers}
+            if len(by_index) < len(questions):
+                raise ValueError(f"expected {len(questions)} answers, got {len(by_index)}")
+            
+            return [
+                self._build_result(by_index[i], prompt)
+                for i in range(1, len(questions) + 1)
+            ]
             
         except Exception as e:
-            logger.error(f"Error generating answer: {e}")
-            return {
-                "answer": "I have relevant experience with this. Let me elaborate...",
-                "confidence": 0.5,
-                "context_used": {}
-            }
+            logger.warning(f"Marshaled answer parsing failed: {e}. Answering individually")
+            return await self.generate_answers_batch(
+                [{"question": q, "type": t} for q, t in zip(questions, types)],
+                resume_data,
+                jd_data,
+                previous_context,
+                precomputed_ctx
+            )
     
-    def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
+    async def _call_llm(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool = False,
+        max_tokens: Optional[int] = None
+    ) -> str:
         """Call Groq API or Ollama to generate answer"""
+        max_tokens = max_tokens or self.max_tokens
+        if self.use_ollama:
+            return await self._call_ollama(system_prompt, user_prompt, json_mode, max_tokens)
+        
         try:
-            if self.use_ollama:
-                # Call local Ollama
-                response = requests.post(
-                    f"{self.ollama_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": f"{system_prompt}\n\n{user_prompt}",
-                        "stream": False,
-                        "options": {
-                            "temperature": self.temperature,
-                            "num_predict": self.max_tokens
-                        }
-                    },
-                    timeout=30
-                )
-                response.raise_for_status()
-                return response.json().get("response", "")
-            
-            else:
-                # Call Groq API using SDK
-                if not self.groq_client:
-                    raise ValueError("Groq client not initialized")
-                    
-                chat_completion = self.groq_client.chat.completions.create(
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    model=self.model,
-                    temperature=self.temperature,
-                    max_tokens=self.max_tokens
-                )
-                return chat_completion.choices[0].message.content or ""
-                
+            answer = await self._call_groq(system_prompt, user_prompt, json_mode, max_tokens)
+            self._record_groq_result(True)
+            return answer
         except Exception as e:
+            # Fall back for this call only; the generator stays on Groq
+            # unless failures keep piling up
             logger.error(f"LLM API error: {e}")
-            if not self.use_ollama:
-                # Try falling back to Ollama
-                logger.info("Falling back to Ollama...")
-                self.use_ollama = True
-                return self._call_llm(system_prompt, user_prompt)
-            raise
+            self._record_groq_result(False)
+            logger.info("Falling back to Ollama for this request...")
+            return await self._call_ollama(system_prompt, user_prompt, json_mode, max_tokens)
     
-    def _build_system_prompt(self, question_type: str) -> str:
-        """Build system prompt based on question type"""
-        base_prompt = "You are an interview candidate responding to questions. "
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.2, max=2),
+        retry=retry_if_exception(_is_transient_groq_error),
+        reraise=True
+    )
+    async def _call_groq(
+        self, system_prompt: str, user_prompt: str, json_mode: bool, max_tokens: int
+    ) -> str:
+        """Call Groq API using SDK, retrying transient errors"""
+        if not self.groq_client:
+            raise ValueError("Groq client not initialized")
         
-        if question_type == "behavioral":
-            return base_prompt + """Use the STAR format (Situation, Task, Action, Result) 
-to structure your answer. Be specific and concise."""
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
+        async with _GROQ_CONCURRENCY, _GROQ_LIMITER:
+            chat_completion = await self.groq_client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                model=self.model,
+                temperature=self.temperature,
+                max_tokens=max_tokens,
+                **extra
+            )
+        return chat_completion.choices[0].message.content or ""
+    
+    async def _call_ollama(
+        self, system_prompt: str, user_prompt: str, json_mode: bool, max_tokens: int
+    ) -> str:
+        """Call local Ollama"""
+        payload = {
+            "model": self.ollama_model,
+            "prompt": f"{system_prompt}\n\n{user_prompt}",
+            "stream": False,
+            "options": {
+                "temperature": self.temperature,
+                "num_predict": max_tokens
+            }
+        }
+        if json_mode:
+            payload["format"] = "json"
+        
+        response = await _ollama_client.post(
+            f"{self.ollama_url}/api/generate",
+            json=payload
+        )
+        response.raise_for_status()
+        return response.json().get("response", "")
+    
+    async def _stream_llm(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """Stream answer chunks from Groq API or Ollama"""
+        if self.use_ollama:
+            async for delta in self._stream_ollama(system_prompt, user_prompt):
+                yield delta
+            return
         
-        elif question_type == "technical":
-            return base_prompt + """Demonstrate technical depth with specific examples from your experience. 
-Mention technologies, tools, and measurable outcomes."""
+        emitted = False
+        try:
+            # Hold a concurrency slot for the whole stream, not just its opening
+            async with _GROQ_CONCURRENCY:
+                stream = await self._open_groq_stream(system_prompt, user_prompt)
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        emitted = True
+                        yield delta
+            self._record_groq_result(True)
+            
+        except Exception as e:
+            logger.error(f"LLM streaming error: {e}")
+            self._record_groq_result(False)
+            if emitted:
+                # Can't splice a second model's answer onto a partial one
+                raise
+            logger.info("Falling back to Ollama for this request...")
+            async for delta in self._stream_ollama(system_prompt, user_prompt):
+                yield delta
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.2, max=2),
+        retry=retry_if_exception(_is_transient_groq_error),
+        reraise=True
+    )
+    async def _open_groq_stream(self, system_prompt: str, user_prompt: str):
+        """Open a Groq streaming completion, retrying transient errors"""
+        if not self.groq_client:
+            raise ValueError("Groq client not initialized")
         
-        else:  # general
-            return base_prompt + """Answer clearly and confidently, backing up claims with 
-specific examples from your experience."""
+        async with _GROQ_LIMITER:
+            return await self.groq_client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                model=self.model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
     
-    def _extract_resume_context(self, resume_data: Dict, question: str) -> str:
+    async def _stream_ollama(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """Stream from local Ollama (newline-delimited JSON)"""
+        async with _ollama_client.stream(
+            "POST",
+            f"{self.ollama_url}/api/generate",
+            json={
+                "model": self.ollama_model,
+                "prompt": f"{system_prompt}\n\n{user_prompt}",
+                "stream": True,
+                "options": {
+                    "temperature": self.temperature,
+                    "num_predict": self.max_tokens
+                }
+            }
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    break
+    
+    def _record_groq_result(self, success: bool):
+        """Track recent Groq outcomes; switch to Ollama only on a sustained failure rate"""
+        self._recent_groq_results.append(success)
+        window = self._recent_groq_results
+        if len(window) < GROQ_FAILURE_MIN_SAMPLES or self.use_ollama:
+            return
+        
+        failure_rate = window.count(False) / len(window)
+        if failure_rate > GROQ_FAILURE_RATE_THRESHOLD:
+            logger.warning(
+                f"Groq failed {failure_rate:.0%} of the last {len(window)} calls, "
+                f"switching to Ollama ({self.ollama_model})"
+            )
+            self.use_ollama = True
+    
+    def _format_previous_context(self, previous_context: Optional[List[Dict]]) -> str:
+        """Format the last few Q&As from follow-up interviews"""
+        if not previous_context:
+            return ""
+        
+        previous_qa_context = "\n\nPREVIOUS INTERVIEW CONTEXT:\n"
+        for qa in previous_context[-3:]:  # Last 3 Q&As
+            previous_qa_context += f"Q: {qa.get('question', '')}\nA: {qa.get('answer', '')}\n\n"
+        return previous_qa_context
+    
+    def _build_system_prompt(self, question_type: str) -> str:
+        """Build system prompt based on question type"""
+        return _SYSTEM_PROMPTS.get(question_type, _SYSTEM_PROMPTS["general"])
+    
+    def build_context(self, resume_data: Dict, jd_data: Dict) -> Dict[str, Any]:
+        """
+        Extract resume and JD context once so it can be reused for every
+        question in a session (neither depends on the question)
+        
+        Returns:
+            Dict with 'resume' and 'jd' context strings and 'tokens', the
+            lowercased context vocabulary used for confidence scoring
+        """
+        resume_context = self._extract_resume_context(resume_data)
+        jd_context = self._extract_jd_context(jd_data)
+        return {
+            "resume": resume_context,
+            "jd": jd_context,
+            "tokens": frozenset((resume_context + " " + jd_context).lower().split())
+        }
+    
+    def _extract_resume_context(self, resume_data: Dict) -> str:
         """Extract relevant sections from resume based on question"""
         context_parts = []
         
@@ -217,7 +623,7 @@ specific examples from your experience."""
         
         return "\n".join(context_parts) if context_parts else "No resume context available"
     
-    def _extract_jd_context(self, jd_data: Dict, question: str) -> str:
+    def _extract_jd_context(self, jd_data: Dict) -> str:
         """Extract relevant sections from job description"""
         context_parts = []
         
@@ -239,17 +645,13 @@ specific examples from your experience."""
         
         return "\n".join(context_parts) if context_parts else "No job description context available"
     
-    def _calculate_confidence(
-        self, question: str, answer: str, resume_ctx: str, jd_ctx: str
-    ) -> float:
-        """Calculate confidence score based on context overlap"""
-        # Simple keyword overlap score
-        question_words = set(question.lower().split())
-        answer_words = set(answer.lower().split())
-        context_words = set((resume_ctx + " " + jd_ctx).lower().split())
+    def _calculate_confidence(self, answer: str, ctx_tokens: frozenset) -> float:
+        """Calculate confidence score based on overlap with the session's context tokens"""
+        # Simple keyword overlap score in a single pass over the answer
+        answer_words = answer.lower().split()
         
         # Check overlap between answer and context
-        overlap = len(answer_words & context_words)
+        overlap = sum(1 for w in answer_words if w in ctx_tokens)
         total = len(answer_words)
         
         if total == 0:
@@ -268,3 +670,93 @@ specific examples from your experience."""
                 if section and len(section) < 50:
                     sections.append(section)
         return ", ".join(sections[:3]) if sections else "General context"
+
+
+_answer_generator: Optional[AnswerGenerator] = None
+
+def get_answer_generator() -> AnswerGenerator:
+    """
+    Process-wide AnswerGenerator; the API key and model don't vary per session,
+    so every session shares one instance and its HTTP connection pool
+    """
+    global _answer_generator
+    if _answer_generator is None:
+        _answer_generator = AnswerGenerator()
+    return _answer_generator
+
+
+class AnswerDispatcher:
+    """Coalesces questions that arrive close together into one marshaled LLM call"""
+    
+    def __init__(
+        self,
+        generator: AnswerGenerator,
+        resume_data: Dict,
+        jd_data: Dict,
+        previous_context: Optional[List[Dict]] = None,
+        precomputed_ctx: Optional[Dict[str, Any]] = None,
+        window: float = MARSHAL_WINDOW_SECONDS,
+        max_batch: int = MARSHAL_MAX_QUESTIONS
+    ):
+        self.generator = generator
+        self.resume_data = resume_data
+        self.jd_data = jd_data
+        self.previous_context = previous_context
+        # The session's build_context result, so batches don't re-extract it
+        self.precomputed_ctx = precomputed_ctx
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+    
+    async def submit(self, question: str, question_type: str = "general") -> Dict[str, Any]:
+        """Queue a question and wait for its answer"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((question, question_type, future))
+        return await future
+    
+    async def _run(self):
+        """Collect questions for up to `window` seconds, then flush as one call"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                results = await self.generator.generate_answers_marshaled(
+                    [q for q, _, _ in batch],
+                    self.resume_data,
+                    self.jd_data,
+                    question_types=[t for _, t, _ in batch],
+                    previous_context=self.previous_context,
+                    precomputed_ctx=self.precomputed_ctx
+                )
+            except Exception as e:
+                logger.error(f"Error generating marshaled answers: {e}")
+                # Let each caller decide how to recover
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+    
+    def close(self):
+        """Stop the background flush task; call when the session ends"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
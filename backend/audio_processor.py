@@ -1,42 +1,328 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from math import gcd
+from typing import Dict, Optional, Union
 import numpy as np
 import soundfile as sf
 import io
+import os
+import queue
+import threading
+import webrtcvad
+from scipy.signal import firwin, resample_poly
 
 logger = logging.getLogger(__name__)
 
+# Scale factor from int16 PCM to float32 in [-1.0, 1.0)
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+# WebRTC VAD only accepts 10/20/30ms frames
+VAD_FRAME_MS = 20
+# Frames per blocking read in a container stream's decoder thread; small so
+# decoded audio is handed over soon after its bytes arrive
+CONTAINER_READ_FRAMES = 1024
+
+@lru_cache(maxsize=16)
+def _polyphase_filter(up: int, down: int) -> np.ndarray:
+    """Anti-aliasing FIR filter for resample_poly (same design as its default)"""
+    max_rate = max(up, down)
+    return firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+
+def ensure_16k_mono(audio: np.ndarray, src_rate: int, target_rate: int = 16000) -> np.ndarray:
+    """Downmix to mono and polyphase-resample to target_rate as float32"""
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    
+    if src_rate != target_rate:
+        divisor = gcd(target_rate, src_rate)
+        up, down = target_rate // divisor, src_rate // divisor
+        audio = resample_poly(audio, up, down, window=_polyphase_filter(up, down))
+    
+    return audio.astype(np.float32, copy=False)
+
+class StreamResampler:
+    """
+    Polyphase-resamples a stream chunk by chunk
+    
+    Output is identical to running resample_poly over the whole stream: the
+    last few input samples are held back until the filter has seen enough
+    audio past them, so chunk boundaries leave no edge artifacts.
+    """
+    
+    def __init__(self, src_rate: int, target_rate: int = 16000):
+        divisor = gcd(target_rate, src_rate)
+        self.up, self.down = target_rate // divisor, src_rate // divisor
+        self._filter = _polyphase_filter(self.up, self.down) if self.up != self.down else None
+        # Input samples on either side of an output sample that reach it through the filter
+        self._reach = (len(self._filter) // 2) // self.up + 1 if self._filter is not None else 0
+        self._pending = np.empty(0, dtype=np.float32)
+        self._base = 0      # Stream position of _pending[0]; always a multiple of down
+        self._received = 0
+        self._emitted = 0
+    
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Feed mono float32 samples; returns the output samples that are now final"""
+        if self.up == self.down:
+            return samples
+        
+        self._pending = np.concatenate((self._pending, samples))
+        self._received += len(samples)
+        settled = self._received - self._reach
+        ready = (settled - 1) * self.up // self.down + 1 if settled > 0 else 0
+        if ready <= self._emitted:
+            return self._pending[:0]
+        
+        out = resample_poly(self._pending, self.up, self.down, window=self._filter)
+        offset = self._base * self.up // self.down
+        out = out[self._emitted - offset:ready - offset].astype(np.float32)
+        self._emitted = ready
+        
+        # Drop input no future output sample can reach, keeping _base on the polyphase grid
+        keep_from = max(0, self._emitted * self.down // self.up - self._reach)
+        keep_from -= keep_from % self.down
+        if keep_from > self._base:
+            self._pending = self._pending[keep_from - self._base:]
+            self._base = keep_from
+        return out
+
+class AudioStream:
+    """
+    Decodes one connection's chunks as a single continuous stream
+    
+    Chunk boundaries don't need to line up with samples or encoded frames: a
+    trailing odd byte of pcm16 is carried into the next chunk, and resampling
+    carries its filter state across chunks. Container bytes are written to a
+    pipe that a decoder thread reads as one WAV or OGG (Vorbis/Opus) stream, so
+    each byte is decoded once and nothing but the pipe is buffered. Its output
+    is handed back on the following chunks. Call close() when the stream ends.
+    """
+    
+    def __init__(self, sample_rate: int, audio_format: str, src_rate: int):
+        self.sample_rate = sample_rate
+        self.audio_format = audio_format
+        self._carry = b""
+        self._resampler = (
+            StreamResampler(src_rate, sample_rate) if audio_format == "pcm16" else None
+        )
+        # Container decoding, started on the first chunk
+        self._decoder: Optional[threading.Thread] = None
+        self._write_fd: Optional[int] = None
+        self._decoded: queue.SimpleQueue = queue.SimpleQueue()
+        self._failed = False
+    
+    def decode(self, audio_bytes: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+        """Convert the next chunk to mono float32 samples at sample_rate"""
+        try:
+            if self.audio_format != "pcm16":
+                return self._decode_container(audio_bytes)
+            audio_data = self._decode_pcm16(audio_bytes)
+            if len(audio_data) == 0:
+                return audio_data
+            return self._resampler.process(audio_data)
+        except Exception as e:
+            logger.error(f"Error processing audio chunk: {e}")
+            return np.array([], dtype=np.float32)
+    
+    def close(self):
+        """End the stream; the container decoder thread exits once it has read the rest"""
+        if self._write_fd is not None:
+            os.close(self._write_fd)
+            self._write_fd = None
+    
+    def _decode_pcm16(self, audio_bytes) -> np.ndarray:
+        audio_bytes = memoryview(audio_bytes).cast("B")
+        if self._carry:
+            audio_bytes = memoryview(self._carry + audio_bytes.tobytes())
+        usable = len(audio_bytes) & ~1
+        self._carry = audio_bytes[usable:].tobytes()
+        samples = np.frombuffer(audio_bytes, dtype="<i2", count=usable // 2)
+        return np.multiply(samples, _PCM16_SCALE, dtype=np.float32)
+    
+    def _decode_container(self, audio_bytes) -> np.ndarray:
+        if self._decoder is None:
+            read_fd, self._write_fd = os.pipe()
+            self._decoder = threading.Thread(target=self._run_decoder, args=(read_fd,), daemon=True)
+            self._decoder.start()
+        
+        if self._failed:
+            # Logged once by the decoder; drop the rest of the stream
+            self.close()
+        elif self._write_fd is not None:
+            try:
+                # Only blocks if the decoder falls a whole pipe buffer (64KB on Linux) behind
+                os.write(self._write_fd, audio_bytes)
+            except OSError as e:
+                logger.error(f"Audio stream decoder stopped: {e}")
+                self._failed = True
+                self.close()
+        
+        blocks = []
+        while True:
+            try:
+                blocks.append(self._decoded.get_nowait())
+            except queue.Empty:
+                break
+        return np.concatenate(blocks) if blocks else np.array([], dtype=np.float32)
+    
+    def _run_decoder(self, read_fd: int):
+        """Decoder thread: read the pipe as one stream and queue mono blocks at sample_rate"""
+        try:
+            # A pipe can't seek, so libsndfile decodes it front to back as bytes arrive
+            with sf.SoundFile(read_fd, closefd=False) as f:
+                resampler = StreamResampler(f.samplerate, self.sample_rate)
+                while True:
+                    block = f.read(CONTAINER_READ_FRAMES, dtype="float32", always_2d=True)
+                    if len(block):
+                        mono = block[:, 0] if block.shape[1] == 1 else block.mean(axis=1, dtype=np.float32)
+                        self._decoded.put(resampler.process(mono))
+                    # A short read means the writer closed the pipe
+                    if len(block) < CONTAINER_READ_FRAMES:
+                        break
+        except Exception as e:
+            logger.error(f"Error decoding audio stream: {e}")
+            self._failed = True
+        finally:
+            os.close(read_fd)
+
+class AudioRingBuffer:
+    """Fixed-capacity circular sample buffer; oldest samples are overwritten when full"""
+    
+    def __init__(self, capacity: int, dtype=np.float32):
+        self._ring = np.empty(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def write(self, data: np.ndarray):
+        """Copy samples into the ring, wrapping around the end"""
+        data = np.asarray(data, dtype=self._ring.dtype).reshape(-1)
+        n = len(data)
+        if n == 0:
+            return
+        
+        if n >= self._capacity:
+            # Only the newest `capacity` samples survive
+            self._ring[:] = data[-self._capacity:]
+            self._start = 0
+            self._size = self._capacity
+            return
+        
+        end = (self._start + self._size) % self._capacity
+        first = min(n, self._capacity - end)
+        np.copyto(self._ring[end:end + first], data[:first])
+        if first < n:
+            np.copyto(self._ring[:n - first], data[first:])
+        
+        overflow = max(0, self._size + n - self._capacity)
+        self._start = (self._start + overflow) % self._capacity
+        self._size = min(self._capacity, self._size + n)
+    
+    def read(self, clear: bool = True) -> np.ndarray:
+        """
+        Return buffered samples in order.
+        
+        When the data is contiguous in the ring this is a view, valid until
+        another `capacity` samples have been written; copy it to keep it longer.
+        """
+        if self._size == 0:
+            return self._ring[:0]
+        
+        end = self._start + self._size
+        if end <= self._capacity:
+            data = self._ring[self._start:end]
+        else:
+            data = np.concatenate((self._ring[self._start:], self._ring[:end - self._capacity]))
+        
+        if clear:
+            # Keep writing after the returned region so the view isn't overwritten
+            self._start = end % self._capacity
+            self._size = 0
+        return data
+
 class AudioProcessor:
     """Handles audio stream processing and buffering"""
     
-    def __init__(self, sample_rate: int = 16000):
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        audio_format: str = "pcm16",
+        max_buffer_seconds: int = 60,
+        src_rate: Optional[int] = None,
+        vad_aggressiveness: int = 2
+    ):
+        """
+        Args:
+            sample_rate: Sample rate delivered downstream (Whisper expects 16kHz)
+            audio_format: 'pcm16' for raw little-endian int16 mono frames of any
+                size (the frontend's AudioWorklet sends 100ms frames: 1600
+                samples = 3200 bytes at 16kHz), or 'container' for one WAV
+                or OGG (Vorbis/Opus) stream split across messages, header first
+            max_buffer_seconds: Audio kept by the buffer before the oldest is dropped
+            src_rate: Sample rate of raw pcm16 input (defaults to sample_rate)
+            vad_aggressiveness: WebRTC VAD mode, 0 (least) to 3 (most aggressive
+                at filtering out non-speech)
+        """
         self.sample_rate = sample_rate
-        self.audio_buffer = []
+        self.src_rate = src_rate or sample_rate
+        self.audio_format = audio_format
+        self.audio_buffer = AudioRingBuffer(sample_rate * max_buffer_seconds)
+        self.vad = webrtcvad.Vad(vad_aggressiveness)
+        self._vad_frame_samples = sample_rate * VAD_FRAME_MS // 1000
+        
+    def process_chunk(self, audio_bytes: Union[bytes, bytearray, memoryview]) -> np.ndarray:
+        """
+        Convert one self-contained payload to a mono float32 array at sample_rate
+        
+        For chunks of a live stream use open_stream(), which keeps decoder and
+        resampler state between chunks.
         
-    def process_chunk(self, audio_bytes: bytes) -> np.ndarray:
-        """Convert audio bytes to numpy array"""
+        Accepts any bytes-like object, so callers can pass a memoryview over
+        a reused bytearray instead of copying it into bytes first.
+        """
         try:
-            audio_data, _ = sf.read(io.BytesIO(audio_bytes))
-            return audio_data
+            if self.audio_format == "pcm16":
+                # Raw PCM needs no container parsing; view the bytes directly
+                audio_bytes = memoryview(audio_bytes).cast("B")
+                samples = np.frombuffer(audio_bytes, dtype="<i2", count=len(audio_bytes) // 2)
+                audio_data = np.multiply(samples, _PCM16_SCALE, dtype=np.float32)
+                return ensure_16k_mono(audio_data, self.src_rate, self.sample_rate)
+            
+            audio_data, src_rate = sf.read(io.BytesIO(audio_bytes), dtype="float32")
+            return ensure_16k_mono(audio_data, src_rate, self.sample_rate)
         except Exception as e:
             logger.error(f"Error processing audio chunk: {e}")
             return np.array([])
     
+    def open_stream(self) -> AudioStream:
+        """Start decoding a connection's chunks as one continuous stream"""
+        return AudioStream(self.sample_rate, self.audio_format, self.src_rate)
+    
+    def speech_ratio(self, audio_data: np.ndarray) -> float:
+        """Fraction of 20ms frames in a mono float32 window that the VAD calls speech"""
+        n_frames = len(audio_data) // self._vad_frame_samples
+        if n_frames == 0:
+            return 0.0
+        
+        frame_bytes = self._vad_frame_samples * 2
+        pcm = np.clip(audio_data[:n_frames * self._vad_frame_samples] * 32767.0, -32768, 32767)
+        pcm = pcm.astype("<i2").tobytes()
+        voiced = sum(
+            self.vad.is_speech(pcm[i:i + frame_bytes], self.sample_rate)
+            for i in range(0, len(pcm), frame_bytes)
+        )
+        return voiced / n_frames
+    
     def add_to_buffer(self, audio_data: np.ndarray):
-        """Add audio data to buffer"""
-        self.audio_buffer.append(audio_data)
+        """Add mono audio data to buffer"""
+        self.audio_buffer.write(audio_data)
     
     def get_buffer(self, clear: bool = True) -> np.ndarray:
         """Get buffered audio and optionally clear"""
-        if not self.audio_buffer:
-            return np.array([])
-        
-        combined = np.concatenate(self.audio_buffer)
-        if clear:
-            self.audio_buffer = []
-        return combined
+        return self.audio_buffer.read(clear=clear)
     
     def save_audio(self, filepath: str, audio_data: np.ndarray):
         """Save audio to file"""
@@ -1,11 +1,17 @@
-import asyncio
 import logging
-from typing import Dict, Set
+from time import monotonic
+from typing import Dict, Optional
 from fastapi import WebSocket
-import json
+import numpy as np
+import orjson
+
+from audio_processor import AudioRingBuffer
 
 logger = logging.getLogger(__name__)
 
+# Raw audio bytes kept per session (~60s of 16kHz PCM16)
+SESSION_AUDIO_BUFFER_BYTES = 16000 * 2 * 60
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time communication"""
     
@@ -18,9 +24,8 @@ class ConnectionManager:
         await websocket.accept()
         self.active_connections[session_id] = websocket
         self.session_data[session_id] = {
-            "audio_buffer": [],
-            "transcript": [],
-            "questions": []
+            "audio_buffer": None,  # Allocated by the first add_to_buffer
+            "ctx": None
         }
         logger.info(f"Client connected for session: {session_id}")
     
@@ -36,7 +41,8 @@ class ConnectionManager:
         """Send message to specific session"""
         if session_id in self.active_connections:
             try:
-                await self.active_connections[session_id].send_json(message)
+                # orjson serializes straight to UTF-8 bytes, skipping the str round-trip
+                await self.active_connections[session_id].send_bytes(orjson.dumps(message))
             except Exception as e:
                 logger.error(f"Error sending message to {session_id}: {e}")
     
@@ -55,7 +61,7 @@ class ConnectionManager:
                 "speaker": speaker,
                 "isFinal": is_final
             },
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": monotonic()
         })
     
     async def send_question_detected(
@@ -71,7 +77,7 @@ class ConnectionManager:
                 "question": question,
                 "confidence": confidence
             },
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": monotonic()
         })
     
     async def send_answer(
@@ -91,7 +97,23 @@ class ConnectionManager:
                 "confidence": confidence,
                 "contextUsed": context_used
             },
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": monotonic()
+        })
+    
+    async def send_answer_delta(
+        self,
+        session_id: str,
+        question_id: str,
+        delta: str
+    ):
+        """Send a partial answer chunk while the answer is still generating"""
+        await self.send_message(session_id, {
+            "type": "answer_delta",
+            "data": {
+                "questionId": question_id,
+                "delta": delta
+            },
+            "timestamp": monotonic()
         })
     
     async def send_error(self, session_id: str, error: str):
@@ -99,19 +121,31 @@ class ConnectionManager:
         await self.send_message(session_id, {
             "type": "error",
             "data": {"message": error},
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": monotonic()
         })
     
     def add_to_buffer(self, session_id: str, audio_chunk: bytes):
         """Add audio chunk to session buffer"""
         if session_id in self.session_data:
-            self.session_data[session_id]["audio_buffer"].append(audio_chunk)
+            session = self.session_data[session_id]
+            if session["audio_buffer"] is None:
+                session["audio_buffer"] = AudioRingBuffer(SESSION_AUDIO_BUFFER_BYTES, dtype=np.uint8)
+            session["audio_buffer"].write(np.frombuffer(audio_chunk, dtype=np.uint8))
+    
+    def get_buffer(self, session_id: str, clear: bool = False) -> bytes:
+        """Get buffered audio bytes for session"""
+        buffer = self.session_data.get(session_id, {}).get("audio_buffer")
+        if buffer is not None:
+            return buffer.read(clear=clear).tobytes()
+        return b""
+    
+    def set_session_context(self, session_id: str, ctx: Dict):
+        """Store precomputed resume/JD context for the session"""
+        if session_id in self.session_data:
+            self.session_data[session_id]["ctx"] = ctx
     
-    def get_buffer(self, session_id: str, clear: bool = False) -> list:
-        """Get audio buffer for session"""
+    def get_session_context(self, session_id: str) -> Optional[Dict]:
+        """Get precomputed resume/JD context for the session"""
         if session_id in self.session_data:
-            buffer = self.session_data[session_id]["audio_buffer"]
-            if clear:
-                self.session_data[session_id]["audio_buffer"] = []
-            return buffer
-        return []
+            return self.session_data[session_id]["ctx"]
+        return None
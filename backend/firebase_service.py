@@ -1,11 +1,17 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import firebase_admin
-from firebase_admin import credentials, firestore, storage
+from firebase_admin import credentials, firestore, firestore_async, storage
 import os
 
 logger = logging.getLogger(__name__)
 
+# Buffered writes are committed together every interval, or sooner once this
+# many are pending (Firestore caps a WriteBatch at 500 operations)
+WRITE_FLUSH_INTERVAL_SECONDS = 0.5
+WRITE_FLUSH_MAX_OPS = 400
+
 class FirebaseService:
     """Handles Firebase Firestore and Storage operations"""
     
@@ -13,6 +19,8 @@ class FirebaseService:
         self.enabled = False
         self.db = None
         self.bucket = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         
         try:
             if not firebase_admin._apps:
@@ -22,25 +30,25 @@ class FirebaseService:
                     firebase_admin.initialize_app(cred, {
                         'storageBucket': os.getenv("FIREBASE_STORAGE_BUCKET")
                     })
-                    self.db = firestore.client()
+                    self.db = firestore_async.client()
                     self.bucket = storage.bucket()
                     self.enabled = True
                     logger.info("Firebase initialized successfully")
                 else:
                     logger.warning("Firebase credentials not found. Running in mock mode.")
             else:
-                self.db = firestore.client()
+                self.db = firestore_async.client()
                 self.bucket = storage.bucket()
                 self.enabled = True
         except Exception as e:
             logger.warning(f"Firebase initialization failed: {e}. Running in mock mode.")
     
-    def get_resume(self, resume_id: str) -> Optional[Dict]:
+    async def get_resume(self, resume_id: str) -> Optional[Dict]:
         """Get resume data from Firestore"""
         if not self.enabled or not self.db:
             return {"parsedData": {"skills": [], "experience": [], "projects": []}}
         try:
-            doc = self.db.collection('resumes').document(resume_id).get()
+            doc = await self.db.collection('resumes').document(resume_id).get()
             if doc.exists:
                 return {**doc.to_dict(), 'id': doc.id}
             return None
@@ -48,12 +56,12 @@ class FirebaseService:
             logger.error(f"Error fetching resume: {e}")
             return None
     
-    def get_job_description(self, jd_id: str) -> Optional[Dict]:
+    async def get_job_description(self, jd_id: str) -> Optional[Dict]:
         """Get job description from Firestore"""
         if not self.enabled or not self.db:
             return {"requiredSkills": [], "responsibilities": [], "companyName": "Test Company", "roleName": "Test Role"}
         try:
-            doc = self.db.collection('jobDescriptions').document(jd_id).get()
+            doc = await self.db.collection('jobDescriptions').document(jd_id).get()
             if doc.exists:
                 return {**doc.to_dict(), 'id': doc.id}
             return None
@@ -61,12 +69,12 @@ class FirebaseService:
             logger.error(f"Error fetching JD: {e}")
             return None
     
-    def get_session(self, session_id: str) -> Optional[Dict]:
+    async def get_session(self, session_id: str) -> Optional[Dict]:
         """Get interview session data"""
         if not self.enabled or not self.db:
             return {"userId": "test", "resumeId": "test", "jdId": "test"}
         try:
-            doc = self.db.collection('interviewSessions').document(session_id).get()
+            doc = await self.db.collection('interviewSessions').document(session_id).get()
             if doc.exists:
                 return {**doc.to_dict(), 'id': doc.id}
             return None
@@ -74,7 +82,68 @@ class FirebaseService:
             logger.error(f"Error fetching session: {e}")
             return None
     
-    def get_previous_sessions(
+    async def get_session_bundle(
+        self,
+        session_id: str,
+        resume_id: Optional[str] = None,
+        jd_id: Optional[str] = None
+    ) -> Tuple[Optional[Dict], Optional[Dict], Optional[Dict]]:
+        """
+        Get session, resume and job description with as few round-trips as possible
+        
+        When resume_id/jd_id are known all three documents are fetched in one
+        get_all call; otherwise the session is read first and the resume and
+        JD it references are fetched together.
+        
+        Returns:
+            (session, resume, job_description); missing documents are None
+        """
+        if not self.enabled or not self.db:
+            return (
+                await self.get_session(session_id),
+                await self.get_resume(resume_id or "test"),
+                await self.get_job_description(jd_id or "test")
+            )
+        try:
+            session_ref = self.db.collection('interviewSessions').document(session_id)
+            
+            if resume_id and jd_id:
+                refs = [
+                    session_ref,
+                    self.db.collection('resumes').document(resume_id),
+                    self.db.collection('jobDescriptions').document(jd_id)
+                ]
+            else:
+                session = self._doc_to_dict(await session_ref.get())
+                if not session:
+                    return None, None, None
+                resume_id = session.get('resumeId')
+                jd_id = session.get('jobDescriptionId')
+                if not resume_id or not jd_id:
+                    return session, None, None
+                refs = [
+                    self.db.collection('resumes').document(resume_id),
+                    self.db.collection('jobDescriptions').document(jd_id)
+                ]
+            
+            # get_all yields in arbitrary order, so map back by path
+            docs = {doc.reference.path: self._doc_to_dict(doc) async for doc in self.db.get_all(refs)}
+            results = [docs.get(ref.path) for ref in refs]
+            
+            if len(results) == 3:
+                return results[0], results[1], results[2]
+            return session, results[0], results[1]
+        except Exception as e:
+            logger.error(f"Error fetching session bundle: {e}")
+            return None, None, None
+    
+    def _doc_to_dict(self, doc) -> Optional[Dict]:
+        """Convert a document snapshot to a dict with its id, or None if missing"""
+        if doc.exists:
+            return {**doc.to_dict(), 'id': doc.id}
+        return None
+    
+    async def get_previous_sessions(
         self, 
         user_id: str, 
         company_name: str, 
@@ -90,46 +159,88 @@ class FirebaseService:
                 .where('companyName', '==', company_name)
                 .where('status', '==', 'completed')
                 .order_by('createdAt', direction=firestore.Query.DESCENDING)
+                .select(['roleName', 'companyName', 'outcome', 'notes', 'createdAt', 'endedAt'])
                 .limit(limit)
                 .stream()
             )
-            return [{'id': doc.id, **doc.to_dict()} for doc in sessions]
+            return [{'id': doc.id, **doc.to_dict()} async for doc in sessions]
         except Exception as e:
             logger.error(f"Error fetching previous sessions: {e}")
             return []
     
-    def save_transcript_segment(self, session_id: str, segment: Dict):
-        """Save transcript segment to Firestore"""
+    async def save_transcript_segment(self, session_id: str, segment: Dict):
+        """Queue transcript segment for the next batched Firestore commit"""
         if not self.enabled or not self.db:
             logger.info(f"Mock: Would save transcript segment for session {session_id}")
             return
-        try:
-            self.db.collection('transcriptSegments').add({
-                **segment,
-                'sessionId': session_id
-            })
-        except Exception as e:
-            logger.error(f"Error saving transcript: {e}")
+        await self._enqueue_write('transcriptSegments', {
+            **segment,
+            'sessionId': session_id
+        })
     
-    def save_question_answer(self, session_id: str, qa: Dict):
-        """Save question-answer pair to Firestore"""
+    async def save_question_answer(self, session_id: str, qa: Dict):
+        """Queue question-answer pair for the next batched Firestore commit"""
         if not self.enabled or not self.db:
             logger.info(f"Mock: Would save Q&A for session {session_id}")
             return
+        await self._enqueue_write('questionsAnswers', {
+            **qa,
+            'sessionId': session_id
+        })
+    
+    async def flush(self):
+        """Commit all pending writes now (e.g. when a session ends)"""
+        if self._write_queue is None:
+            return
+        pending = []
+        while not self._write_queue.empty():
+            pending.append(self._write_queue.get_nowait())
+        await self._commit_writes(pending)
+    
+    async def _enqueue_write(self, collection: str, data: Dict[str, Any]):
+        """Add a write to the buffer, starting the background writer if needed"""
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._run_writer())
+        await self._write_queue.put((collection, data))
+    
+    async def _run_writer(self):
+        """Collect writes for up to the flush interval, then commit them as one batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._write_queue.get()]
+            deadline = loop.time() + WRITE_FLUSH_INTERVAL_SECONDS
+            
+            while len(pending) < WRITE_FLUSH_MAX_OPS:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(self._write_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._commit_writes(pending)
+    
+    async def _commit_writes(self, pending: List[Tuple[str, Dict[str, Any]]]):
+        """Commit buffered writes in a single WriteBatch"""
+        if not pending:
+            return
         try:
-            self.db.collection('questionsAnswers').add({
-                **qa,
-                'sessionId': session_id
-            })
+            batch = self.db.batch()
+            for collection, data in pending:
+                batch.set(self.db.collection(collection).document(), data)
+            await batch.commit()
         except Exception as e:
-            logger.error(f"Error saving Q&A: {e}")
+            logger.error(f"Error committing {len(pending)} buffered writes: {e}")
     
-    def update_session(self, session_id: str, updates: Dict):
+    async def update_session(self, session_id: str, updates: Dict):
         """Update session data"""
         if not self.enabled or not self.db:
             logger.info(f"Mock: Would update session {session_id}")
             return
         try:
-            self.db.collection('interviewSessions').document(session_id).update(updates)
+            await self.db.collection('interviewSessions').document(session_id).update(updates)
         except Exception as e:
             logger.error(f"Error updating session: {e}")
@@ -1,7 +1,7 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Set
 import os
 import logging
 from dotenv import load_dotenv
@@ -10,11 +10,11 @@ import asyncio
 
 # Import custom modules
 from connection_manager import ConnectionManager
-from transcription_service import TranscriptionService
+from transcription_service import TranscriptionService, TranscriptionBatcher
 from question_detector import QuestionDetector
-from answer_generator import AnswerGenerator
+from answer_generator import AnswerDispatcher, MARSHAL_MAX_QUESTIONS, get_answer_generator
 from firebase_service import FirebaseService
-from audio_processor import AudioProcessor
+from audio_processor import AudioProcessor, AudioRingBuffer
 
 # Configure logging
 logging.basicConfig(
@@ -29,11 +29,54 @@ app = FastAPI(title="AI Interview Assistant API", version="1.0.0")
 
 # Initialize services
 connection_manager = ConnectionManager()
-transcription_service = TranscriptionService(model_name=os.getenv("WHISPER_MODEL", "base"))
+WHISPER_CONCURRENCY = int(os.getenv("WHISPER_CONCURRENCY", "2"))
+transcription_service = TranscriptionService(
+    model_name=os.getenv("WHISPER_MODEL", "base"),
+    num_workers=WHISPER_CONCURRENCY
+)
 question_detector = QuestionDetector()
-answer_generator = AnswerGenerator()
+answer_generator = get_answer_generator()
 firebase_service = FirebaseService()
-audio_processor = AudioProcessor()
+# Fire-and-forget tasks (e.g. Firestore saves); referenced here so they
+# aren't garbage collected before they finish
+background_tasks: Set[asyncio.Task] = set()
+
+def run_in_background(coro) -> asyncio.Task:
+    """Schedule a coroutine off the user-facing path"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+# Batches windows from concurrent sessions into shared Whisper runs (in worker
+# threads); WHISPER_CONCURRENCY caps runs in flight, sized to the GPU/CPU rather
+# than the number of connected clients
+transcription_batcher = TranscriptionBatcher(
+    transcription_service,
+    max_concurrency=WHISPER_CONCURRENCY
+)
+
+async def transcribe(audio_array) -> dict:
+    """Transcribe a window without blocking the event loop"""
+    return await transcription_batcher.submit(audio_array)
+
+audio_processor = AudioProcessor(
+    audio_format=os.getenv("AUDIO_FORMAT", "pcm16"),
+    src_rate=int(os.getenv("AUDIO_INPUT_RATE", "16000")),
+    vad_aggressiveness=int(os.getenv("VAD_AGGRESSIVENESS", "2"))
+)
+# Windows with fewer voiced VAD frames than this skip Whisper entirely
+VAD_MIN_SPEECH_RATIO = float(os.getenv("VAD_MIN_SPEECH_RATIO", "0.3"))
+# Transcribe every STRIDE seconds of new audio; each window also repeats the last
+# OVERLAP seconds of the previous one so words on the boundary aren't cut, and
+# the words in the overlap are sent from only one of the two windows
+TRANSCRIBE_STRIDE_SECONDS = float(os.getenv("TRANSCRIBE_STRIDE_SECONDS", "1.3"))
+TRANSCRIBE_OVERLAP_SECONDS = float(os.getenv("TRANSCRIBE_OVERLAP_SECONDS", "0.2"))
+STRIDE_SAMPLES = int(audio_processor.sample_rate * TRANSCRIBE_STRIDE_SECONDS)
+OVERLAP_SAMPLES = int(audio_processor.sample_rate * TRANSCRIBE_OVERLAP_SECONDS)
+WINDOW_SAMPLES = STRIDE_SAMPLES + OVERLAP_SAMPLES
+# Max items waiting between pipeline stages in a session
+PIPELINE_QUEUE_SIZE = 4
 
 # CORS Configuration (robust parsing + optional regex)
 # Supports:
@@ -112,17 +155,13 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     await connection_manager.connect(websocket, session_id)
     logger.info(f"WebSocket connection established for session: {session_id}")
     
-    # Get session data from Firebase
-    session_data = firebase_service.get_session(session_id)
+    # Get the session, then its resume and JD together in one batched read
+    session_data, resume_data, jd_data = await firebase_service.get_session_bundle(session_id)
     if not session_data:
         await connection_manager.send_error(session_id, "Session not found")
         connection_manager.disconnect(session_id)
         return
     
-    # Get resume and JD data
-    resume_data = firebase_service.get_resume(session_data['resumeId'])
-    jd_data = firebase_service.get_job_description(session_data['jobDescriptionId'])
-    
     if not resume_data or not jd_data:
         await connection_manager.send_error(session_id, "Resume or JD not found")
         connection_manager.disconnect(session_id)
@@ -131,95 +170,68 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     # Get previous sessions for context (if follow-up)
     previous_qa = []
     if session_data.get('isFollowUp'):
-        prev_sessions = firebase_service.get_previous_sessions(
+        prev_sessions = await firebase_service.get_previous_sessions(
             session_data['userId'],
             session_data['companyName']
         )
         # Get Q&A from previous sessions
         # TODO: Implement fetching previous Q&A
     
-    audio_buffer = []
+    # Resume/JD context is the same for every question, so extract it once
+    session_ctx = answer_generator.build_context(resume_data, jd_data)
+    connection_manager.set_session_context(session_id, session_ctx)
+    # Answers questions that queue up behind a streaming answer in one LLM call
+    dispatcher = AnswerDispatcher(
+        answer_generator, resume_data, jd_data, previous_qa, precomputed_ctx=session_ctx
+    )
+    
+    # Three stages joined by bounded queues so a slow LLM answer never stalls
+    # audio ingest: receive loop -> transcription worker -> answer worker
+    audio_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    question_queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    workers = [
+        asyncio.create_task(_transcription_worker(session_id, audio_queue, question_queue)),
+        asyncio.create_task(_answer_worker(session_id, question_queue, dispatcher, resume_data, jd_data, previous_qa))
+    ]
+    
+    # Chunks are decoded and resampled as one stream, not one by one
+    audio_stream = audio_processor.open_stream()
+    # Newest audio; room for a full window even when a chunk lands well past the stride
+    audio_window = AudioRingBuffer(2 * WINDOW_SAMPLES)
+    new_samples = 0
+    received = 0        # Samples in the stream so far
+    emitted_until = 0   # Stream position the text sent so far reaches
     
     try:
         while True:
-            # Receive audio chunks from client
+            # Receive audio chunks from client and decode them as they arrive
             data = await websocket.receive_bytes()
-            audio_buffer.append(data)
+            samples = audio_stream.decode(data)
+            audio_window.write(samples)
+            new_samples += len(samples)
+            received += len(samples)
             
-            # Process every 3 seconds of audio
-            if len(audio_buffer) >= 30:  # ~3 seconds at 10 chunks/sec
-                # Combine audio chunks
-                combined_audio = b''.join(audio_buffer)
-                audio_buffer = []
-                
-                # Process audio
-                audio_array = audio_processor.process_chunk(combined_audio)
+            # Hand off a window once a stride of new audio has arrived
+            if new_samples >= STRIDE_SAMPLES:
+                # The new audio plus the overlap before it (less at the start of the stream)
+                length = min(new_samples + OVERLAP_SAMPLES, len(audio_window))
+                new_samples = 0
+                audio_array = audio_window.read(clear=False)[-length:]
+                start = received - length
                 
-                if len(audio_array) > 0:
-                    # Transcribe
-                    transcription_result = transcription_service.transcribe_audio(audio_array)
-                    transcript_text = transcription_result['text']
-                    
-                    if transcript_text:
-                        # For now, assume all audio is from recruiter
-                        # TODO: Implement speaker diarization
-                        speaker = 'recruiter'
-                        
-                        # Send transcript to client
-                        await connection_manager.send_transcript(
-                            session_id,
-                            transcript_text,
-                            speaker,
-                            is_final=True
-                        )
-                        
-                        # Save transcript to Firebase
-                        firebase_service.save_transcript_segment(session_id, {
-                            'speaker': speaker,
-                            'text': transcript_text,
-                            'timestamp': asyncio.get_event_loop().time(),
-                            'isFinal': True
-                        })
-                        
-                        # Check if it's a question
-                        question_result = question_detector.is_question(transcript_text)
-                        
-                        if question_result['is_question']:
-                            # Notify client that question was detected
-                            await connection_manager.send_question_detected(
-                                session_id,
-                                transcript_text,
-                                question_result['confidence']
-                            )
-                            
-                            # Generate answer
-                            answer_result = answer_generator.generate_answer(
-                                question=transcript_text,
-                                resume_data=resume_data,
-                                jd_data=jd_data,
-                                question_type=question_result['type'],
-                                previous_context=previous_qa
-                            )
-                            
-                            # Send answer to client
-                            question_id = f"{session_id}_{int(asyncio.get_event_loop().time())}"
-                            await connection_manager.send_answer(
-                                session_id,
-                                question_id,
-                                answer_result['answer'],
-                                answer_result['confidence'],
-                                answer_result['context_used']
-                            )
-                            
-                            # Save Q&A to Firebase
-                            firebase_service.save_question_answer(session_id, {
-                                'question': transcript_text,
-                                'questionTimestamp': asyncio.get_event_loop().time(),
-                                'suggestedAnswer': answer_result['answer'],
-                                'confidence': answer_result['confidence'],
-                                'contextUsed': answer_result['context_used'],
-                                'wasUsed': False
-                            })
+                # Silence and background noise never reach Whisper
+                if audio_processor.speech_ratio(audio_array) >= VAD_MIN_SPEECH_RATIO:
+                    # The overlap is split at its midpoint: text from the previous
+                    # window ran up to emitted_until and this one's picks up there
+                    keep_from = max(0, emitted_until - start)
+                    keep_until = length - OVERLAP_SAMPLES // 2
+                    emitted_until = start + keep_until
+                    # Copy: the ring keeps filling while this window waits to be transcribed
+                    await audio_queue.put((
+                        audio_array.copy(),
+                        keep_from / audio_processor.sample_rate,
+                        keep_until / audio_processor.sample_rate
+                    ))
             
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for session: {session_id}")
@@ -228,6 +240,163 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
         logger.error(f"WebSocket error for session {session_id}: {e}")
         await connection_manager.send_error(session_id, str(e))
         connection_manager.disconnect(session_id)
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        dispatcher.close()
+        audio_stream.close()
+        # Don't leave this session's transcript/Q&A sitting in the write buffer
+        await firebase_service.flush()
+
+def _words_between(transcription_result: dict, start: float, end: float) -> str:
+    """Text of the transcribed words whose midpoint lies in [start, end) seconds"""
+    return "".join(
+        word for word, word_start, word_end in transcription_result['words']
+        if start <= (word_start + word_end) / 2 < end
+    ).strip()
+
+def _put_drop_oldest(queue: asyncio.Queue, item):
+    """Enqueue without waiting, discarding the oldest item if the queue is full"""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(item)
+
+async def _transcription_worker(
+    session_id: str,
+    audio_queue: asyncio.Queue,
+    question_queue: asyncio.Queue
+):
+    """Pipeline stages 1-2: transcribe windows, send transcripts, detect questions"""
+    loop = asyncio.get_running_loop()
+    while True:
+        audio_array, keep_from, keep_until = await audio_queue.get()
+        try:
+            transcription_result = await transcribe(audio_array)
+            # Words in the overlap are transcribed twice; send them from one window only
+            transcript_text = _words_between(transcription_result, keep_from, keep_until)
+            if not transcript_text:
+                continue
+            
+            # One timestamp per chunk, shared by the transcript and any Q&A
+            ts = loop.time()
+            
+            # For now, assume all audio is from recruiter
+            # TODO: Implement speaker diarization
+            speaker = 'recruiter'
+            
+            # Send transcript to client
+            await connection_manager.send_transcript(
+                session_id,
+                transcript_text,
+                speaker,
+                is_final=True
+            )
+            
+            # Save transcript to Firebase
+            run_in_background(firebase_service.save_transcript_segment(session_id, {
+                'speaker': speaker,
+                'text': transcript_text,
+                'timestamp': ts,
+                'isFinal': True
+            }))
+            
+            # Check if it's a question
+            question_result = question_detector.is_question(transcript_text)
+            
+            if question_result['is_question']:
+                # Notify client that question was detected
+                await connection_manager.send_question_detected(
+                    session_id,
+                    transcript_text,
+                    question_result['confidence']
+                )
+                # If answers fall behind, the stalest question is the one to drop
+                _put_drop_oldest(question_queue, (transcript_text, question_result['type'], ts))
+        except Exception as e:
+            logger.error(f"Transcription pipeline error for session {session_id}: {e}")
+
+async def _send_answer(session_id: str, question: str, ts: float, answer_result: dict):
+    """Send a finished answer to the client and save the Q&A"""
+    await connection_manager.send_answer(
+        session_id,
+        f"{session_id}_{int(ts)}",
+        answer_result['answer'],
+        answer_result['confidence'],
+        answer_result['context_used']
+    )
+    
+    # Save Q&A to Firebase without holding up the next question
+    run_in_background(firebase_service.save_question_answer(session_id, {
+        'question': question,
+        'questionTimestamp': ts,
+        'suggestedAnswer': answer_result['answer'],
+        'confidence': answer_result['confidence'],
+        'contextUsed': answer_result['context_used'],
+        'wasUsed': False
+    }))
+
+async def _answer_backlog(session_id: str, dispatcher: AnswerDispatcher, backlog: list):
+    """Answer questions that piled up; the dispatcher coalesces them into one call"""
+    results = await asyncio.gather(
+        *(dispatcher.submit(question, question_type) for question, question_type, _ in backlog),
+        return_exceptions=True
+    )
+    for (question, _, ts), answer_result in zip(backlog, results):
+        if isinstance(answer_result, Exception):
+            logger.error(f"Answer pipeline error for session {session_id}: {answer_result}")
+            continue
+        await _send_answer(session_id, question, ts, answer_result)
+
+async def _answer_worker(
+    session_id: str,
+    question_queue: asyncio.Queue,
+    dispatcher: AnswerDispatcher,
+    resume_data: dict,
+    jd_data: dict,
+    previous_qa: list
+):
+    """Pipeline stage 3: stream an answer for each detected question"""
+    while True:
+        question, question_type, ts = await question_queue.get()
+        
+        # Questions that arrived while the last answer streamed are answered
+        # together rather than one LLM call each
+        backlog = [(question, question_type, ts)]
+        while not question_queue.empty() and len(backlog) < MARSHAL_MAX_QUESTIONS:
+            backlog.append(question_queue.get_nowait())
+        if len(backlog) > 1:
+            try:
+                await _answer_backlog(session_id, dispatcher, backlog)
+            except Exception as e:
+                logger.error(f"Answer pipeline error for session {session_id}: {e}")
+            continue
+        
+        try:
+            # Stream answer to client as it generates
+            question_id = f"{session_id}_{int(ts)}"
+            answer_result = None
+            async for event in answer_generator.generate_answer_stream(
+                question=question,
+                resume_data=resume_data,
+                jd_data=jd_data,
+                question_type=question_type,
+                previous_context=previous_qa,
+                precomputed_ctx=connection_manager.get_session_context(session_id)
+            ):
+                if 'delta' in event:
+                    await connection_manager.send_answer_delta(
+                        session_id, question_id, event['delta']
+                    )
+                else:
+                    answer_result = event['result']
+            
+            # Send final answer to client
+            await _send_answer(session_id, question, ts, answer_result)
+        except Exception as e:
+            logger.error(f"Answer pipeline error for session {session_id}: {e}")
 
 # Resume Upload & Parsing
 @app.post("/api/v1/resume/upload")
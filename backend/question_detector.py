@@ -1,9 +1,37 @@
 import logging
 from typing import Dict, List, Optional, Any
 import re
+import numpy as np
+import ahocorasick
 
 logger = logging.getLogger(__name__)
 
+# Behavioral indicators
+BEHAVIORAL_KEYWORDS = [
+    'tell me about a time',
+    'describe a situation',
+    'give me an example',
+    'experience with',
+    'challenge you faced',
+    'conflict',
+    'team',
+    'leadership'
+]
+
+# Technical indicators
+TECHNICAL_KEYWORDS = [
+    'how does',
+    'explain',
+    'implement',
+    'algorithm',
+    'system design',
+    'architecture',
+    'code',
+    'database',
+    'api',
+    'performance'
+]
+
 class QuestionDetector:
     """Detects when a question is being asked using pattern matching and heuristics"""
     
@@ -14,14 +42,25 @@ class QuestionDetector:
             r'\b(tell me|describe|explain|discuss|talk about)\b',
             r'\b(can you|could you|would you|will you)\b',
             r'\b(do you|did you|have you|are you|were you)\b',
-            r'\?$',  # Ends with question mark
         ]
         
-        # Compile patterns
-        self.compiled_patterns = [
-            re.compile(pattern, re.IGNORECASE) 
-            for pattern in self.question_patterns
-        ]
+        # Compile all patterns into one alternation so the text is scanned once;
+        # each pattern gets its own named group to tell which ones matched.
+        # Patterns are lowercase and only ever run on lowercased text, so the
+        # regex doesn't need IGNORECASE
+        self.question_regex = re.compile(
+            "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(self.question_patterns))
+        )
+        self._pattern_index = {f"p{i}": i for i in range(len(self.question_patterns))}
+        
+        # One Aho-Corasick automaton over every type keyword, so the text is
+        # scanned once instead of once per keyword
+        self.type_automaton = ahocorasick.Automaton()
+        for keyword in TECHNICAL_KEYWORDS:
+            self.type_automaton.add_word(keyword, 'technical')
+        for keyword in BEHAVIORAL_KEYWORDS:
+            self.type_automaton.add_word(keyword, 'behavioral')
+        self.type_automaton.make_automaton()
     
     def is_question(self, text: str) -> Dict[str, Any]:
         """
@@ -30,74 +69,49 @@ class QuestionDetector:
         Returns:
             dict with 'is_question' (bool), 'confidence' (float), 'type' (str)
         """
-        if not text or len(text.strip()) < 5:
+        text = text.strip() if text else ""
+        if len(text) < 5:
             return {
                 "is_question": False,
                 "confidence": 0.0,
                 "type": None
             }
         
-        text = text.strip()
-        matches = 0
+        # Lowercased once and shared by the pattern scan and type detection
+        text_lower = text.lower()
+        
+        # A trailing question mark settles it without any pattern matching
+        if text.endswith('?'):
+            return {
+                "is_question": True,
+                "confidence": 1.0,
+                "type": self._determine_type(text_lower)
+            }
         
-        # Check patterns
-        for pattern in self.compiled_patterns:
-            if pattern.search(text):
-                matches += 1
+        # Count distinct patterns matched, in a single pass over the text
+        matches = len({m.lastgroup for m in self.question_regex.finditer(text_lower)})
         
         # Calculate confidence based on matches
         confidence = min(matches / 2.0, 1.0)  # 2+ matches = high confidence
         
-        # Determine question type
-        question_type = self._determine_type(text)
-        
-        is_question = matches >= 1 or text.endswith('?')
+        is_question = matches >= 1
         
         return {
             "is_question": is_question,
             "confidence": confidence if is_question else 0.0,
-            "type": question_type if is_question else None
+            "type": self._determine_type(text_lower) if is_question else None
         }
     
-    def _determine_type(self, text: str) -> str:
-        """Determine question type (technical, behavioral, situational)"""
-        text_lower = text.lower()
-        
-        # Behavioral indicators
-        behavioral_keywords = [
-            'tell me about a time',
-            'describe a situation',
-            'give me an example',
-            'experience with',
-            'challenge you faced',
-            'conflict',
-            'team',
-            'leadership'
-        ]
-        
-        # Technical indicators
-        technical_keywords = [
-            'how does',
-            'explain',
-            'implement',
-            'algorithm',
-            'system design',
-            'architecture',
-            'code',
-            'database',
-            'api',
-            'performance'
-        ]
-        
-        for keyword in behavioral_keywords:
-            if keyword in text_lower:
+    def _determine_type(self, text_lower: str) -> str:
+        """Determine question type (technical, behavioral, situational) from lowercased text"""
+        # Behavioral keywords take priority wherever they appear in the text
+        question_type = 'general'
+        for _, keyword_type in self.type_automaton.iter(text_lower):
+            if keyword_type == 'behavioral':
                 return 'behavioral'
+            question_type = 'technical'
         
-        for keyword in technical_keywords:
-            if keyword in text_lower:
-                return 'technical'
-        
-        return 'general'
+        return question_type
     
     def extract_questions(self, segments: List[Dict[str, str]]) -> List[Dict]:
         """
@@ -109,19 +123,47 @@ class QuestionDetector:
         Returns:
             List of detected questions with metadata
         """
-        questions = []
-        
+        # Keep recruiter segments long enough to be questions
+        candidates = []
         for i, segment in enumerate(segments):
             if segment.get('speaker') == 'recruiter':
-                result = self.is_question(segment.get('text', ''))
-                
-                if result['is_question']:
-                    questions.append({
-                        'text': segment['text'],
-                        'timestamp': segment.get('timestamp', 0),
-                        'confidence': result['confidence'],
-                        'type': result['type'],
-                        'segment_index': i
-                    })
+                text = (segment.get('text') or '').strip()
+                if len(text) >= 5:
+                    candidates.append((i, segment, text, text.lower()))
+        
+        if not candidates:
+            return []
+        
+        # Run the pattern regex once over all candidate texts, then map each match
+        # back to its segment through the start offsets
+        lengths = np.fromiter((len(c[3]) + 1 for c in candidates), dtype=np.int64, count=len(candidates))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        joined = "\n".join(text_lower for _, _, _, text_lower in candidates)
+        
+        match_starts = []
+        match_patterns = []
+        for m in self.question_regex.finditer(joined):
+            match_starts.append(m.start())
+            match_patterns.append(self._pattern_index[m.lastgroup])
+        
+        # Segment x pattern hit matrix; confidence counts distinct patterns per row
+        hits = np.zeros((len(candidates), len(self.question_patterns)), dtype=bool)
+        if match_starts:
+            rows = np.searchsorted(starts, match_starts, side='right') - 1
+            hits[rows, match_patterns] = True
+        counts = hits.sum(axis=1)
+        ends_with_qmark = np.fromiter((c[2].endswith('?') for c in candidates), dtype=bool, count=len(candidates))
+        confidence = np.where(ends_with_qmark, 1.0, np.minimum(counts / 2.0, 1.0))
+        
+        questions = []
+        for k in np.flatnonzero(ends_with_qmark | (counts > 0)):
+            i, segment, _, text_lower = candidates[k]
+            questions.append({
+                'text': segment['text'],
+                'timestamp': segment.get('timestamp', 0),
+                'confidence': float(confidence[k]),
+                'type': self._determine_type(text_lower),
+                'segment_index': i
+            })
         
         return questions
@@ -1,17 +1,80 @@
-import whisper
+from faster_whisper import WhisperModel
+from faster_whisper.audio import pad_or_trim
+from faster_whisper.tokenizer import Tokenizer
+from faster_whisper.transcribe import get_suppressed_tokens
+import asyncio
+import ctranslate2
 import logging
-from typing import Optional, Dict, Any
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 import numpy as np
+import xxhash
+from numba import njit
 
 logger = logging.getLogger(__name__)
 
+# Mean-square energy below which a window is treated as silence
+SILENCE_ENERGY_THRESHOLD = 1e-5
+# Transcriptions remembered for repeated audio
+TRANSCRIPT_CACHE_SIZE = 256
+# Initial size of the per-thread scratch buffer (10s at 16kHz)
+SCRATCH_SAMPLES = 16000 * 10
+# Windows from different sessions arriving this close together share one model run
+TRANSCRIBE_BATCH_WINDOW_SECONDS = 0.05
+TRANSCRIBE_MAX_BATCH = int(os.getenv("WHISPER_BATCH_SIZE", "8"))
+# Same no-speech rule faster-whisper applies when skipping a segment
+NO_SPEECH_THRESHOLD = 0.6
+LOG_PROB_THRESHOLD = -1.0
+
+@njit(cache=True, fastmath=True)
+def _mean_confidence(avg_logprobs: np.ndarray) -> float:
+    """Mean of exp(avg_logprob) over segments; 0.0 when there are none"""
+    n = avg_logprobs.shape[0]
+    if n == 0:
+        return 0.0
+    total = 0.0
+    for i in range(n):
+        total += math.exp(avg_logprobs[i])
+    return total / n
+
+def _detect_device() -> str:
+    """Pick CUDA when CTranslate2 can see a GPU, else CPU"""
+    try:
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    except Exception:
+        return "cpu"
+
 class TranscriptionService:
-    """Handles real-time transcription using Whisper"""
+    """Handles real-time transcription using faster-whisper (CTranslate2)"""
     
-    def __init__(self, model_name: str = "base"):
+    def __init__(self, model_name: str = "base", num_workers: int = 1):
+        """
+        Args:
+            model_name: Whisper model size or path to a converted CTranslate2 model
+            num_workers: Model replicas, so that many threads can transcribe in parallel
+        """
         self.model_name = model_name
+        self.num_workers = num_workers
         self.model = None  # Lazy load on first use
         self.sample_rate = 16000
+        self.device = os.getenv("WHISPER_DEVICE") or _detect_device()
+        # INT8 weights with FP16 activations on GPU, plain INT8 on CPU
+        self.compute_type = os.getenv("WHISPER_COMPUTE_TYPE") or (
+            "int8_float16" if self.device == "cuda" else "int8"
+        )
+        # 0 lets CTranslate2 pick; split the cores between workers on shared hosts
+        self.cpu_threads = int(os.getenv("WHISPER_CPU_THREADS", "0"))
+        # LRU of audio fingerprint -> result; guarded since calls run in worker threads
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        # Scratch audio buffer per worker thread, reused across calls
+        self._scratch = threading.local()
+        # Compile (or load the cached) confidence kernel now, not on the first chunk
+        _mean_confidence(np.zeros(1, dtype=np.float64))
         logger.info(f"TranscriptionService initialized (model will load on first use: {model_name})")
     
     def transcribe_audio(
@@ -23,53 +86,342 @@ class TranscriptionService:
         Transcribe audio data
         
         Returns:
-            dict with 'text', 'language', 'confidence'
+            dict with 'text', 'language', 'confidence' and 'words': (word, start,
+            end) tuples, in seconds from the start of audio_data
         """
         try:
-            # Lazy load model on first transcription
-            if self.model is None:
-                logger.info(f"Loading Whisper model: {self.model_name}")
-                self.model = whisper.load_model(self.model_name)
-                logger.info("Whisper model loaded successfully")
+            audio_data, cache_key, result = self._prepare_audio(audio_data, language)
+            if result is not None:
+                return result
             
-            if len(audio_data) == 0:
-                return {"text": "", "language": language, "confidence": 0.0}
+            self._load_model()
             
-            # Ensure audio is float32 and normalized
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
-            
-            # Normalize
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data))
-            
-            # Transcribe
-            result = self.model.transcribe(
+            # Transcribe (segments is a lazy generator; decoding runs as it's consumed)
+            segments, info = self.model.transcribe(
                 audio_data,
                 language=language,
-                fp16=False,
-                verbose=False
+                beam_size=1,
+                vad_filter=True,
+                word_timestamps=True
             )
+            segments = list(segments)
             
-            return {
-                "text": result["text"].strip(),
-                "language": result.get("language", language),
-                "confidence": self._calculate_confidence(result)
+            result = {
+                "text": "".join(seg.text for seg in segments).strip(),
+                "language": info.language or language,
+                "confidence": self._calculate_confidence(segments),
+                "words": [(w.word, w.start, w.end) for seg in segments for w in seg.words or ()]
             }
+            self._cache_result(cache_key, result)
+            return dict(result)
             
         except Exception as e:
             logger.error(f"Transcription error: {e}")
-            return {"text": "", "language": language, "confidence": 0.0}
+            return {"text": "", "language": language, "confidence": 0.0, "words": []}
+    
+    def transcribe_batch(
+        self,
+        audios: List[np.ndarray],
+        language: str = "en"
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe several short windows (<= 30s each) with one encoder/decoder pass
+        
+        Skips the VAD filter and temperature fallback of transcribe_audio in
+        exchange for running the whole batch through the model at once.
+        
+        Returns:
+            list of dicts shaped like transcribe_audio's, in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(audios)
+        try:
+            self._load_model()
+            extractor = self.model.feature_extractor
+            
+            pending = []  # (index, cache_key, mel features, content frames)
+            for i, audio_data in enumerate(audios):
+                audio_data, cache_key, result = self._prepare_audio(audio_data, language)
+                if result is not None:
+                    results[i] = result
+                    continue
+                # Features are computed right away; audio_data is the reused scratch buffer
+                features = extractor(audio_data)
+                content_frames = features.shape[-1] - extractor.nb_max_frames
+                pending.append((
+                    i,
+                    cache_key,
+                    pad_or_trim(features[:, :content_frames], extractor.nb_max_frames),
+                    min(content_frames, extractor.nb_max_frames)
+                ))
+            
+            if pending:
+                tokenizer = Tokenizer(
+                    self.model.hf_tokenizer,
+                    self.model.model.is_multilingual,
+                    task="transcribe",
+                    language=language
+                )
+                prompt = self.model.get_prompt(tokenizer, [], without_timestamps=True)
+                mels = ctranslate2.StorageView.from_array(
+                    np.ascontiguousarray(np.stack([mel for _, _, mel, _ in pending]))
+                )
+                encoder_output = self.model.model.encode(mels)
+                outputs = self.model.model.generate(
+                    encoder_output,
+                    [prompt] * len(pending),
+                    beam_size=1,
+                    max_length=self.model.max_length,
+                    return_scores=True,
+                    return_no_speech_prob=True,
+                    suppress_blank=True,
+                    suppress_tokens=get_suppressed_tokens(tokenizer, [-1])
+                )
+                
+                decoded = []  # (text tokens, avg_logprob)
+                for output in outputs:
+                    tokens = output.sequences_ids[0]
+                    # Scores are length-normalized cumulative log-probs; undo that
+                    avg_logprob = output.scores[0] * len(tokens) / (len(tokens) + 1)
+                    silent = output.no_speech_prob > NO_SPEECH_THRESHOLD and avg_logprob < LOG_PROB_THRESHOLD
+                    decoded.append(([] if silent else tokens, avg_logprob))
+                
+                timings = self._word_timings(
+                    tokenizer,
+                    encoder_output,
+                    [tokens for tokens, _ in decoded],
+                    [frames for _, _, _, frames in pending]
+                )
+                for (i, cache_key, _, _), (tokens, avg_logprob), words in zip(pending, decoded, timings):
+                    result = {
+                        "text": tokenizer.decode(tokens).strip(),
+                        "language": language,
+                        "confidence": float(_mean_confidence(np.array([avg_logprob]))),
+                        "words": words
+                    }
+                    self._cache_result(cache_key, result)
+                    results[i] = dict(result)
+            
+        except Exception as e:
+            logger.error(f"Batch transcription error: {e}")
+        
+        return [
+            result if result is not None else {"text": "", "language": language, "confidence": 0.0, "words": []}
+            for result in results
+        ]
     
-    def _calculate_confidence(self, result: Dict) -> float:
-        """Calculate average confidence from segments"""
-        if "segments" not in result or not result["segments"]:
-            return 0.0
+    def _word_timings(
+        self,
+        tokenizer: Tokenizer,
+        encoder_output: ctranslate2.StorageView,
+        token_lists: List[List[int]],
+        num_frames: List[int]
+    ) -> List[List[Tuple[str, float, float]]]:
+        """
+        (word, start, end) times in seconds for each decoded window
         
-        confidences = []
-        for segment in result["segments"]:
-            if "no_speech_prob" in segment:
-                # Convert no_speech_prob to confidence
-                confidences.append(1.0 - segment["no_speech_prob"])
+        One batched cross-attention alignment over the encoder output already
+        computed, timed the same way faster-whisper's find_alignment does it.
+        """
+        if not any(token_lists):
+            return [[] for _ in token_lists]
         
-        return sum(confidences) / len(confidences) if confidences else 0.5
+        # Every item needs a token to align; a window with no text aligns just EOT
+        alignments = self.model.model.align(
+            encoder_output,
+            tokenizer.sot_sequence,
+            [tokens or [tokenizer.eot] for tokens in token_lists],
+            num_frames
+        )
+        timings = []
+        for tokens, alignment in zip(token_lists, alignments):
+            words, word_tokens = tokenizer.split_to_word_tokens(tokens + [tokenizer.eot])
+            if len(word_tokens) <= 1:
+                timings.append([])
+                continue
+            
+            pairs = np.array(alignment.alignments, dtype=np.int64).reshape(-1, 2)
+            # Time of the first alignment step on each text token
+            jumps = np.pad(np.diff(pairs[:, 0]), (1, 0), constant_values=1).astype(bool)
+            jump_times = pairs[jumps, 1] / self.model.tokens_per_second
+            boundaries = np.pad(np.cumsum([len(t) for t in word_tokens[:-1]]), (1, 0))
+            timings.append([
+                (word, float(jump_times[start]), float(jump_times[end]))
+                for word, start, end in zip(words, boundaries[:-1], boundaries[1:])
+            ])
+        return timings
+    
+    def _load_model(self):
+        """Lazy load model on first transcription"""
+        if self.model is not None:
+            return
+        with self._model_lock:
+            if self.model is None:
+                logger.info(
+                    f"Loading Whisper model: {self.model_name} "
+                    f"({self.device}, {self.compute_type})"
+                )
+                self.model = WhisperModel(
+                    self.model_name,
+                    device=self.device,
+                    compute_type=self.compute_type,
+                    cpu_threads=self.cpu_threads,
+                    num_workers=self.num_workers
+                )
+                logger.info("Whisper model loaded successfully")
+    
+    def _prepare_audio(
+        self,
+        audio_data: np.ndarray,
+        language: str
+    ) -> Tuple[np.ndarray, Optional[tuple], Optional[Dict[str, Any]]]:
+        """
+        Normalize audio and look it up in the result cache
+        
+        Returns:
+            (audio, cache_key, result): result is set when no inference is needed
+            (empty or silent audio, or a cache hit). audio is this thread's
+            scratch buffer, valid until the next call on the same thread
+        """
+        if len(audio_data) == 0:
+            return audio_data, None, {"text": "", "language": language, "confidence": 0.0, "words": []}
+        
+        # Copy (casting to float32 if needed) into this thread's scratch buffer and
+        # work on that in place; the caller may still own audio_data
+        buf = self._scratch_buffer(len(audio_data))
+        np.copyto(buf, audio_data, casting='unsafe')
+        audio_data = buf
+        
+        # Silence never needs the model
+        if float(np.dot(audio_data, audio_data)) / len(audio_data) < SILENCE_ENERGY_THRESHOLD:
+            return audio_data, None, {"text": "", "language": language, "confidence": 0.0, "words": []}
+        
+        # Normalize to peak 1.0 without allocating a |x| temporary
+        peak = max(float(audio_data.max()), -float(audio_data.min()))
+        if peak > 0:
+            audio_data *= np.float32(1.0 / peak)
+        
+        # Fingerprint the int8-quantized audio so repeats skip inference
+        cache_key = (
+            xxhash.xxh3_64_intdigest(np.round(audio_data * 127).astype(np.int8).tobytes()),
+            len(audio_data),
+            language
+        )
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return audio_data, cache_key, dict(cached)
+        
+        return audio_data, cache_key, None
+    
+    def _cache_result(self, cache_key: tuple, result: Dict[str, Any]):
+        """Remember a transcription, evicting the least recently used"""
+        with self._cache_lock:
+            self._cache[cache_key] = result
+            if len(self._cache) > TRANSCRIPT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _scratch_buffer(self, n: int) -> np.ndarray:
+        """Return this thread's float32 scratch buffer sliced to n samples"""
+        buf = getattr(self._scratch, "buf", None)
+        if buf is None or len(buf) < n:
+            buf = np.empty(max(n, SCRATCH_SAMPLES), dtype=np.float32)
+            self._scratch.buf = buf
+        return buf[:n]
+    
+    def _calculate_confidence(self, segments: list) -> float:
+        """Calculate average confidence from segment log-probabilities"""
+        # avg_logprob is the mean token log-probability; exp() maps it to (0, 1]
+        avg_logprobs = np.fromiter(
+            (seg.avg_logprob for seg in segments), dtype=np.float64, count=len(segments)
+        )
+        return float(_mean_confidence(avg_logprobs))
+
+class TranscriptionBatcher:
+    """Coalesces windows from concurrent sessions into batched model runs"""
+    
+    def __init__(
+        self,
+        service: TranscriptionService,
+        max_concurrency: int = 2,
+        window: float = TRANSCRIBE_BATCH_WINDOW_SECONDS,
+        max_batch: int = TRANSCRIBE_MAX_BATCH
+    ):
+        """
+        Args:
+            service: TranscriptionService doing the actual inference
+            max_concurrency: Model runs (batches) allowed in flight at once
+            window: Seconds to wait for more windows after the first arrives
+            max_batch: Most windows sent through the model together
+        """
+        self.service = service
+        self.window = window
+        self.max_batch = max_batch
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._running: set = set()
+    
+    async def submit(self, audio_data: np.ndarray, language: str = "en") -> Dict[str, Any]:
+        """Queue a window and wait for its transcription"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((audio_data, language, future))
+        return await future
+    
+    async def _run(self):
+        """Collect windows for up to `window` seconds, then run them as one batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            # Don't start collecting until a model slot is free, so windows keep
+            # piling into the next batch while the current ones run
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.window
+            
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            task = asyncio.create_task(self._transcribe(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+    
+    async def _transcribe(self, batch: List[tuple]):
+        """Run one batch in a worker thread and resolve each caller's future"""
+        try:
+            # A batch only shares the decoder prompt, so split it by language
+            by_language: Dict[str, List[tuple]] = {}
+            for item in batch:
+                by_language.setdefault(item[1], []).append(item)
+            
+            for language, items in by_language.items():
+                if len(items) == 1:
+                    results = [await asyncio.to_thread(self.service.transcribe_audio, items[0][0], language)]
+                else:
+                    results = await asyncio.to_thread(
+                        self.service.transcribe_batch, [audio for audio, _, _ in items], language
+                    )
+                for (_, _, future), result in zip(items, results):
+                    if not future.done():
+                        future.set_result(result)
+        except Exception as e:
+            logger.error(f"Error running transcription batch: {e}")
+            for _, language, future in batch:
+                if not future.done():
+                    future.set_result({"text": "", "language": language, "confidence": 0.0, "words": []})
+        finally:
+            self._slots.release()
+    
+    def close(self):
+        """Stop the background batching task"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -10,7 +10,7 @@ import { withAuth } from '@/components/auth/AuthProvider';
 import { formatDuration } from '@/lib/utils';
 import { useWebSocket } from '@/hooks/useWebSocket';
 import { useAudioStreaming } from '@/hooks/useAudioStreaming';
-import type { TranscriptSegment, QuestionAnswer, WSMessage, WSTranscriptMessage, WSQuestionDetectedMessage, WSAnswerGeneratedMessage } from '@/types';
+import type { TranscriptSegment, QuestionAnswer, WSMessage, WSTranscriptMessage, WSQuestionDetectedMessage, WSAnswerDeltaMessage, WSAnswerGeneratedMessage } from '@/types';
 
 function InterviewPage() {
   const { currentSession, transcriptSegments, addTranscriptSegment, addQuestionAnswer, updateQuestionAnswer } = useStore();
@@ -64,6 +64,18 @@ function InterviewPage() {
         break;
       }
 
+      case 'answer_delta': {
+        const deltaMsg = message as WSAnswerDeltaMessage;
+        if (deltaMsg.data.questionId !== currentQuestionId) {
+          // First chunk of a new answer replaces the placeholder
+          setCurrentQuestionId(deltaMsg.data.questionId);
+          setCurrentAnswer(deltaMsg.data.delta);
+        } else {
+          setCurrentAnswer((prev) => prev + deltaMsg.data.delta);
+        }
+        break;
+      }
+
       case 'answer_generated': {
         const answerMsg = message as WSAnswerGeneratedMessage;
         setCurrentAnswer(answerMsg.data.answer);
@@ -124,11 +136,9 @@ function InterviewPage() {
 
     // Start audio streaming
     await startStreaming((audioChunk) => {
-      // Send audio chunk to backend via WebSocket
+      // Send the raw PCM frame to backend via WebSocket
       if (isConnected) {
-        audioChunk.arrayBuffer().then((buffer) => {
-          sendMessage(buffer);
-        });
+        sendMessage(audioChunk);
       }
     });
   }, [startStreaming, isConnected, sendMessage]);
@@ -2,14 +2,20 @@
 
 import { useState, useRef, useCallback } from 'react';
 
+// The backend expects raw 16-bit mono PCM at 16kHz (AUDIO_FORMAT=pcm16)
+const PCM_SAMPLE_RATE = 16000;
+// Samples per websocket message: 100ms = 1600 samples = 3200 bytes
+const PCM_FRAME_SAMPLES = 1600;
+
 export function useAudioStreaming() {
   const [isStreaming, setIsStreaming] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  const mediaRecorderRef = useRef<MediaRecorder | null>(null);
+  const audioContextRef = useRef<AudioContext | null>(null);
+  const workletRef = useRef<AudioWorkletNode | null>(null);
   const streamRef = useRef<MediaStream | null>(null);
 
   const startStreaming = useCallback(async (
-    onDataAvailable: (chunk: Blob) => void
+    onDataAvailable: (chunk: ArrayBuffer) => void
   ) => {
     try {
       setError(null);
@@ -18,7 +24,7 @@ export function useAudioStreaming() {
       const stream = await navigator.mediaDevices.getUserMedia({ 
         audio: {
           channelCount: 1,
-          sampleRate: 16000,
+          sampleRate: PCM_SAMPLE_RATE,
           echoCancellation: true,
           noiseSuppression: true,
         } 
@@ -26,27 +32,29 @@ export function useAudioStreaming() {
       
       streamRef.current = stream;
 
-      // Create MediaRecorder
-      const mediaRecorder = new MediaRecorder(stream, {
-        mimeType: 'audio/webm;codecs=opus'
-      });
+      // Run the graph at 16kHz so the browser resamples the microphone for us
+      const audioContext = new AudioContext({ sampleRate: PCM_SAMPLE_RATE });
+      audioContextRef.current = audioContext;
+      await audioContext.audioWorklet.addModule('/pcm16-worklet.js');
 
-      mediaRecorderRef.current = mediaRecorder;
+      // Converts to int16 PCM and posts one frame at a time
+      const worklet = new AudioWorkletNode(audioContext, 'pcm16-capture', {
+        numberOfOutputs: 0,
+        processorOptions: { frameSamples: PCM_FRAME_SAMPLES },
+      });
+      workletRef.current = worklet;
 
       // Handle data available
-      mediaRecorder.ondataavailable = (event) => {
-        if (event.data.size > 0) {
-          onDataAvailable(event.data);
-        }
+      worklet.port.onmessage = (event: MessageEvent<ArrayBuffer>) => {
+        onDataAvailable(event.data);
       };
 
-      mediaRecorder.onerror = (event) => {
-        console.error('MediaRecorder error:', event);
+      worklet.onprocessorerror = (event) => {
+        console.error('Audio worklet error:', event);
         setError('Recording error occurred');
       };
 
-      // Start recording in chunks (100ms intervals)
-      mediaRecorder.start(100);
+      audioContext.createMediaStreamSource(stream).connect(worklet);
       setIsStreaming(true);
 
     } catch (err) {
@@ -57,8 +65,15 @@ export function useAudioStreaming() {
   }, []);
 
   const stopStreaming = useCallback(() => {
-    if (mediaRecorderRef.current && mediaRecorderRef.current.state !== 'inactive') {
-      mediaRecorderRef.current.stop();
+    if (workletRef.current) {
+      workletRef.current.port.onmessage = null;
+      workletRef.current.disconnect();
+      workletRef.current = null;
+    }
+
+    if (audioContextRef.current) {
+      audioContextRef.current.close();
+      audioContextRef.current = null;
     }
 
     if (streamRef.current) {
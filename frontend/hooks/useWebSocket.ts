@@ -49,14 +49,13 @@ export function useWebSocket({
 
       ws.onmessage = (event) => {
         try {
-          // Handle binary data (if backend sends audio back - not used currently)
-          if (event.data instanceof ArrayBuffer) {
-            console.log('Received binary data:', event.data.byteLength, 'bytes');
-            return;
-          }
+          // Backend sends JSON messages as UTF-8 encoded binary frames
+          const text = event.data instanceof ArrayBuffer
+            ? new TextDecoder().decode(event.data)
+            : event.data;
 
           // Handle JSON messages
-          const message = JSON.parse(event.data);
+          const message = JSON.parse(text);
           setLastMessage(message);
           onMessage?.(message);
         } catch (error) {
@@ -0,0 +1,33 @@
+// Converts microphone audio to 16-bit little-endian PCM and posts it to the
+// main thread in fixed-size frames (the backend's AUDIO_FORMAT=pcm16 input)
+class Pcm16CaptureProcessor extends AudioWorkletProcessor {
+  constructor(options) {
+    super();
+    this.frameSamples = options.processorOptions.frameSamples;
+    this.frame = new Int16Array(this.frameSamples);
+    this.length = 0;
+  }
+
+  process(inputs) {
+    // First channel only; the stream is requested as mono
+    const input = inputs[0] && inputs[0][0];
+    if (!input) {
+      return true;
+    }
+
+    for (let i = 0; i < input.length; i++) {
+      const sample = Math.max(-1, Math.min(1, input[i]));
+      this.frame[this.length++] = sample < 0 ? sample * 0x8000 : sample * 0x7fff;
+
+      if (this.length === this.frameSamples) {
+        // Transfer the buffer instead of copying it, then start a new frame
+        this.port.postMessage(this.frame.buffer, [this.frame.buffer]);
+        this.frame = new Int16Array(this.frameSamples);
+        this.length = 0;
+      }
+    }
+    return true;
+  }
+}
+
+registerProcessor('pcm16-capture', Pcm16CaptureProcessor);
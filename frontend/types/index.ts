@@ -122,7 +122,7 @@ export interface AudioRecorderState {
 
 // WebSocket Message Types
 export interface WSMessage {
-  type: 'transcript' | 'question_detected' | 'answer_generated' | 'error';
+  type: 'transcript' | 'question_detected' | 'answer_delta' | 'answer_generated' | 'error';
   data: unknown;
   timestamp?: number;
 }
@@ -144,6 +144,14 @@ export interface WSQuestionDetectedMessage extends WSMessage {
   };
 }
 
+export interface WSAnswerDeltaMessage extends WSMessage {
+  type: 'answer_delta';
+  data: {
+    questionId: string;
+    delta: string;
+  };
+}
+
 export interface WSAnswerGeneratedMessage extends WSMessage {
   type: 'answer_generated';
   data: {
@@ -1,104 +1,103 @@
 from __future__ import annotations
 
 import os
+import re
+import queue
+import signal
 import sys
 import threading
 import time
-import queue
+from concurrent.futures import ThreadPoolExecutor
 import textwrap
 import shutil
-import numpy as np
-import sounddevice as sd
 import importlib.util
 from pathlib import Path
 
-# Add src/core to path for imports
+# Add src/core to path for imports. numpy, sounddevice and Whisper are imported
+# where they are first used so profile selection comes up without waiting on them
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src', 'core'))
 
-from audio_device_util import pick_system_audio_device
-from audio_transcriber import load_whisper, transcribe_chunk
+# Splits streamed text into words, keeping the space/newline separators
+SEPARATOR_RE = re.compile(r'([ \n])')
+
+# Longest stretch one recording keeps; the capture buffer is sized for it up front
+MAX_RECORDING_SECONDS = int(os.environ.get("MAX_RECORDING_SECONDS", "300"))
+
+# Seconds of speech Whisper is handed at a time while recording is still going
+LIVE_WINDOW_SECONDS = float(os.environ.get("LIVE_WINDOW_SECONDS", "5"))
+
+# Practice mode: how many alternative answers to generate for each question
+PRACTICE_ANSWERS = int(os.environ.get("PRACTICE_ANSWERS", "1"))
+
+# Width used for wrapped output, read once instead of per print. POSIX terminals
+# refresh it on resize; elsewhere it is refreshed before each question
+response_width = min(shutil.get_terminal_size().columns - 4, 100)
+
+def refresh_response_width(*_):
+    global response_width
+    response_width = min(shutil.get_terminal_size().columns - 4, 100)
+
+if hasattr(signal, "SIGWINCH"):
+    signal.signal(signal.SIGWINCH, refresh_response_width)
 
 class WordWrapper:
     """Real-time word wrapper for streaming text"""
     
     def __init__(self, width: int = None, indent: str = ""):
-        self.width = width or min(shutil.get_terminal_size().columns - 4, 100)
+        self.width = width or response_width
         self.indent = indent
         self.buffer = ""
-        self.current_line = ""
+        # Words on the current line, joined only when the line is emitted
+        self.words = []
         self.current_line_length = len(indent)
         
     def add_token(self, token: str) -> str:
         """Add token and return any complete lines to print"""
-        self.buffer += token
-        output = ""
+        # One split gives [word, sep, word, sep, ..., partial word]
+        parts = SEPARATOR_RE.split(self.buffer + token)
+        self.buffer = parts[-1]
+        output = []
         
-        while ' ' in self.buffer or '\n' in self.buffer:
-            space_pos = self.buffer.find(' ')
-            newline_pos = self.buffer.find('\n')
+        for i in range(0, len(parts) - 1, 2):
+            word = parts[i]
+            if word:
+                result = self._add_word_to_line(word)
+                if result:
+                    output.append(result)
             
-            if newline_pos != -1 and (space_pos == -1 or newline_pos < space_pos):
-                word = self.buffer[:newline_pos]
-                self.buffer = self.buffer[newline_pos + 1:]
-                
-                if word:
-                    result = self._add_word_to_line(word)
-                    if result:
-                        output += result
-                
-                if self.current_line.strip():
-                    output += self.current_line + '\n'
-                self._reset_line()
-                
-            elif space_pos != -1:
-                word = self.buffer[:space_pos]
-                self.buffer = self.buffer[space_pos + 1:]
-                
-                if word:
-                    result = self._add_word_to_line(word)
-                    if result:
-                        output += result
+            if parts[i + 1] == '\n':
+                output.append(self._take_line())
         
-        return output
+        return "".join(output)
     
     def _add_word_to_line(self, word: str) -> str:
         word_length = len(word)
         
-        if self.current_line_length + word_length + 1 <= self.width:
-            if self.current_line:
-                self.current_line += " " + word
-                self.current_line_length += word_length + 1
-            else:
-                self.current_line = self.indent + word
-                self.current_line_length = len(self.indent) + word_length
-            return ""
-        else:
-            output = ""
-            if self.current_line.strip():
-                output = self.current_line + '\n'
-            
-            self.current_line = self.indent + word
-            self.current_line_length = len(self.indent) + word_length
-            return output
+        # Start a new line first if the word doesn't fit on this one
+        output = "" if self.current_line_length + word_length + 1 <= self.width else self._take_line()
+        
+        self.current_line_length += word_length + 1 if self.words else word_length
+        self.words.append(word)
+        return output
+    
+    def _take_line(self) -> str:
+        """Return the current line (with newline, or "" if blank) and start a new one"""
+        line = self.indent + " ".join(self.words) if self.words else ""
+        self._reset_line()
+        return line + '\n' if line.strip() else ""
     
     def _reset_line(self):
-        self.current_line = ""
+        self.words = []
         self.current_line_length = len(self.indent)
     
     def flush(self) -> str:
         output = ""
         
         if self.buffer.strip():
-            result = self._add_word_to_line(self.buffer.strip())
-            if result:
-                output += result
+            output += self._add_word_to_line(self.buffer.strip())
             self.buffer = ""
         
-        if self.current_line.strip():
-            output += self.current_line + '\n'
-            self._reset_line()
-        
-        return output
+        return output + self._take_line()
 
 def select_profile():
     """Simple profile selection from profiles directory"""
@@ -111,16 +110,18 @@ def select_profile():
         print("ERROR: No profiles directory found!")
         return None, None, None
     
-    users = []
-    for item in profiles_dir.iterdir():
-        if item.is_dir() and not item.name.startswith('.') and not item.name.startswith('__'):
-            users.append(item.name)
+    # scandir answers is_dir()/is_file() from the directory listing, without a stat per entry
+    with os.scandir(profiles_dir) as entries:
+        users = [
+            entry.name for entry in entries
+            if entry.is_dir() and not entry.name.startswith('.') and not entry.name.startswith('__')
+        ]
     
     if not users:
         print("ERROR: No user profiles found!")
         return None, None, None
     
-    print(f"\nAvailable users:")
+    print("\nAvailable users:")
     for i, user in enumerate(users, 1):
         print(f"  {i}. {user}")
     
@@ -134,12 +135,12 @@ def select_profile():
     except (ValueError, KeyboardInterrupt):
         return None, None, None
     
-    user_dir = profiles_dir / selected_user
     roles = []
-    for item in user_dir.iterdir():
-        if item.is_file() and item.suffix == '.py' and not item.name.startswith('__'):
-            role_name = item.stem.replace('_', ' ').title()
-            roles.append((item.stem, role_name))
+    with os.scandir(profiles_dir / selected_user) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.py') and not entry.name.startswith('__'):
+                stem = entry.name[:-3]
+                roles.append((stem, stem.replace('_', ' ').title()))
     
     if not roles:
         print(f"ERROR: No role profiles found for {selected_user}")
@@ -169,9 +170,22 @@ def load_profile_module(user, role_file):
     if not profile_path.exists():
         raise FileNotFoundError(f"Profile not found: {profile_path}")
     
-    spec = importlib.util.spec_from_file_location("selected_profile", profile_path)
+    # Reuse the already-executed module unless the profile file has changed
+    module_name = f"profile_{user}_{role_file}"
+    mtime = profile_path.stat().st_mtime_ns
+    cached = sys.modules.get(module_name)
+    if cached is not None and getattr(cached, "__profile_mtime__", None) == mtime:
+        return cached
+    
+    spec = importlib.util.spec_from_file_location(module_name, profile_path)
     profile_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(profile_module)
+    profile_module.__profile_mtime__ = mtime
+    sys.modules[module_name] = profile_module
+    try:
+        spec.loader.exec_module(profile_module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
     
     return profile_module
 
@@ -186,8 +200,18 @@ def load_role_job_description(user, role_file):
         "jd.txt"
     ]
     
+    # List each candidate directory once instead of stat-ing every path
+    listings = {}
     for path in possible_paths:
-        if os.path.exists(path):
+        directory, name = os.path.split(path)
+        if directory not in listings:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    listings[directory] = {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+            except OSError:
+                listings[directory] = set()
+        
+        if os.path.normcase(name) in listings[directory]:
             try:
                 with open(path, "r", encoding="utf-8") as f:
                     content = f.read().strip()
@@ -210,6 +234,13 @@ def show_startup_info():
         print("No profile selected. Exiting...")
         sys.exit(1)
     
+    # Whisper is the slowest step and doesn't depend on the profile, so load it and
+    # read the context files in the background while the profile and audio device load
+    startup = ThreadPoolExecutor(max_workers=3, thread_name_prefix="startup")
+    pending_model = startup.submit(load_whisper_model)
+    pending_context = startup.submit(load_context)
+    pending_job_description = startup.submit(load_role_job_description, user, role_file)
+    
     try:
         print(f"Loading profile: {user} - {role_display}")
         profile_module = load_profile_module(user, role_file)
@@ -217,11 +248,12 @@ def show_startup_info():
         print("✓ Profile loaded successfully\n")
     except Exception as e:
         print(f"ERROR: Failed to load profile: {e}")
+        startup.shutdown(wait=False, cancel_futures=True)
         sys.exit(1)
     
     print("--- Context Loading ---")
-    context = load_context()
-    job_description = load_role_job_description(user, role_file)
+    context = pending_context.result()
+    job_description = pending_job_description.result()
     
     if context:
         print(f"✓ General context: {len(context.split())} words loaded")
@@ -234,6 +266,7 @@ def show_startup_info():
         print("⚠ No role-specific job description found")
     
     print("\n--- Audio Setup ---")
+    from audio_device_util import pick_system_audio_device
     device_pick = pick_system_audio_device(prefer_rate=48000)
     device_short = device_pick.name[:50] + "..." if len(device_pick.name) > 50 else device_pick.name
     print(f"Selected: {device_short}")
@@ -241,22 +274,23 @@ def show_startup_info():
     
     print("\n--- Model Loading ---")
     print("Loading Whisper...", end="", flush=True)
-    model = load_whisper()
+    model = pending_model.result()
+    startup.shutdown()
     print(" ✓")
     print("LLM ready ✓")
     
     terminal_width = shutil.get_terminal_size().columns
-    print(f"\n--- Display Setup ---")
+    print("\n--- Display Setup ---")
     print(f"Terminal width: {terminal_width} columns")
-    print(f"Response width: {min(terminal_width - 4, 100)} columns")
+    print(f"Response width: {response_width} columns")
     
     print(f"\n{'='*60}")
     print("READY FOR INTERVIEW")
     print(f"User: {user} | Role: {role_display}")
     print(f"{'='*60}")
     print("Controls:")
-    print("• Press ENTER to START recording")
-    print("• Press ENTER again to STOP recording")
+    print("• Press SPACE or ENTER to START recording")
+    print("• Press SPACE or ENTER again to STOP recording")
     print("• Press SPACE during AI response to interrupt")
     print("• Press CTRL+C to exit")
     print(f"{'='*60}\n")
@@ -275,22 +309,185 @@ def load_context() -> str:
                 pass
     return ""
 
-def record_manual_control(device_index: int, samplerate: int, wasapi_loopback: bool):
-    """Manual start/stop recording with ENTER key"""
+def load_whisper_model():
+    """Import the transcriber (and Whisper with it) and load the model"""
+    from audio_transcriber import load_whisper
+    return load_whisper()
+
+class LiveTranscriber:
+    """Transcribes a recording window by window while it is still being captured"""
+    
+    NO_TEXT = ("(no speech detected)", "(transcription failed)")
+    
+    def __init__(self, model, samplerate: int):
+        self.model = model
+        self.samplerate = samplerate
+        self.window = int(LIVE_WINDOW_SECONDS * samplerate)
+        # Finished windows; only the audio after `done` is still untranscribed
+        self.transcript = []
+        self.done = 0
+        self._stop = threading.Event()
+        self._thread = None
+        
+    def start(self, buffer, get_written):
+        """Follow `buffer` as the recorder fills it; get_written() is its write index"""
+        self.buffer = buffer
+        self.get_written = get_written
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        
+    def _run(self):
+        while not self._stop.wait(0.25):
+            written = self.get_written()
+            if written - self.done >= self.window:
+                self._transcribe_until(self._quiet_point(written))
+                
+    def _quiet_point(self, written: int) -> int:
+        """End the window at the quietest 10ms in its last second, so words aren't cut"""
+        import numpy as np
+        block = max(self.samplerate // 100, 1)
+        start = max(written - self.samplerate, self.done + block)
+        count = (written - start) // block
+        if count < 2:
+            return written
+        tail = self.buffer[start:start + count * block].reshape(count, -1)
+        return start + int(np.argmin(np.einsum('ij,ij->i', tail, tail))) * block
+        
+    def _transcribe_until(self, end: int):
+        from audio_transcriber import transcribe_chunk
+        chunk = self.buffer[self.done:end]
+        audio = chunk.mean(axis=1) if chunk.shape[1] > 1 else chunk[:, 0]
+        # The tail of what was already heard keeps Whisper consistent across windows
+        prompt = " ".join(self.transcript)[-200:] or None
+        text = transcribe_chunk(self.model, audio, self.samplerate, initial_prompt=prompt)
+        if text not in self.NO_TEXT:
+            self.transcript.append(text)
+        self.done = end
+        
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            
+    def finish(self) -> str:
+        """Stop following the recording, transcribe what is left and return the full text"""
+        self.stop()
+        if self._thread is not None and self.get_written() > self.done:
+            self._transcribe_until(self.get_written())
+        return " ".join(self.transcript) or self.NO_TEXT[0]
+
+class KeyReader:
+    """Single key presses from one reader thread for the whole session.
+    While `interrupt` holds an event, SPACE sets it instead of being queued"""
+    
+    TOGGLE_KEYS = (" ", "\r", "\n")
     
-    audio_queue = queue.Queue()
+    def __init__(self):
+        self.events = queue.SimpleQueue()
+        self.interrupt = None
+        self._restore = None
+        
+    def start(self):
+        try:
+            import msvcrt
+            read_key = msvcrt.getwch
+        except ImportError:
+            read_key = self._posix_reader()
+        threading.Thread(target=self._run, args=(read_key,), daemon=True).start()
+        
+    def _posix_reader(self):
+        fd = sys.stdin.fileno()
+        try:
+            import termios
+            import tty
+            old_attrs = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+            self._restore = lambda: termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+        except Exception:
+            pass  # Not a terminal; keys arrive a line at a time
+        return lambda: os.read(fd, 1).decode(errors="ignore") or None
+        
+    def _run(self, read_key):
+        while True:
+            try:
+                ch = read_key()
+            except Exception:
+                ch = None
+            interrupt = self.interrupt
+            if ch == " " and interrupt is not None and not interrupt.is_set():
+                interrupt.set()
+                print("\n\n⏹ INTERRUPTED")
+                continue
+            self.events.put(ch)
+            if ch is None:
+                return  # Input closed
+                
+    def discard_pending(self):
+        """Drop keys pressed while nothing was waiting for them"""
+        try:
+            while True:
+                self.events.get_nowait()
+        except queue.Empty:
+            pass
+            
+    def wait(self, keys=TOGGLE_KEYS) -> str:
+        """Block until one of `keys` is pressed. Ctrl+C or closed input ends the session"""
+        while True:
+            ch = self.events.get()
+            if ch is None or ch == "\x03":
+                raise KeyboardInterrupt
+            if ch in keys:
+                return ch
+                
+    def close(self):
+        if self._restore is not None:
+            self._restore()
+            self._restore = None
+
+# Recording buffer shared by every question; see capture_buffer()
+_capture_buffer = None
+
+def capture_buffer(samplerate: int, channels: int):
+    """MAX_RECORDING_SECONDS of float32 frames, allocated once and reused while the
+    device format stays the same. The next recording overwrites it, so anything still
+    reading the last one (LiveTranscriber) must be finished first"""
+    global _capture_buffer
+    import numpy as np
+    shape = (MAX_RECORDING_SECONDS * samplerate, channels)
+    if _capture_buffer is None or _capture_buffer.shape != shape:
+        _capture_buffer = None  # Let the old one go before allocating its replacement
+        _capture_buffer = np.empty(shape, dtype=np.float32)
+    return _capture_buffer
+
+def record_manual_control(device_index: int, samplerate: int, wasapi_loopback: bool, keys: KeyReader, live: LiveTranscriber = None):
+    """Manual start/stop recording with SPACE or ENTER. Returns (frames captured, seconds),
+    or None if the device or stream failed. When `live` is given it transcribes the recording while it is being captured"""
+    import numpy as np
+    import sounddevice as sd
+    
+    channels = 2 if wasapi_loopback else 1
+    # The callback only copies into this buffer, so nothing is allocated on the
+    # realtime audio thread and small low-latency blocks are cheap. It is the
+    # single writer; `live` only reads what it has already written
+    buffer = capture_buffer(samplerate, channels)
+    written = 0
     recording = threading.Event()
     
     def audio_callback(indata, frames, time_info, status):
+        nonlocal written
         if recording.is_set():
-            audio_queue.put(indata.copy())
+            n = min(len(indata), len(buffer) - written)
+            np.copyto(buffer[written:written + n], indata[:n])
+            written += n
     
     if wasapi_loopback:
         stream_params = {
             'device': (None, device_index),
             'samplerate': samplerate,
-            'channels': 2,
+            'channels': channels,
             'dtype': 'float32',
+            'blocksize': 512,
+            'latency': 'low',
             'callback': audio_callback,
             'extra_settings': sd.WasapiSettings(loopback=True)
         }
@@ -298,51 +495,48 @@ def record_manual_control(device_index: int, samplerate: int, wasapi_loopback: b
         stream_params = {
             'device': device_index,
             'samplerate': samplerate,
-            'channels': 1,
+            'channels': channels,
             'dtype': 'float32',
+            'blocksize': 512,
+            'latency': 'low',
             'callback': audio_callback,
         }
     
     try:
         with sd.InputStream(**stream_params):
-            input()
-            print("🔴 RECORDING... (Press ENTER to stop)")
+            keys.wait()
+            print("🔴 RECORDING... (Press SPACE or ENTER to stop)")
             recording.set()
             start_time = time.time()
+            if live is not None:
+                live.start(buffer, lambda: written)
             
-            input()
+            keys.wait()
             recording.clear()
             elapsed = time.time() - start_time
             print(f"⏹ Stopped ({elapsed:.1f}s)")
             
-            frames = []
-            while not audio_queue.empty():
-                frames.append(audio_queue.get())
-            
-            if not frames:
-                return np.zeros((1, 1), dtype=np.float32), elapsed
-            
-            audio = np.concatenate(frames, axis=0)
-            if audio.ndim == 2 and audio.shape[1] > 1:
-                audio = np.mean(audio, axis=1, keepdims=True)
-            elif audio.ndim == 1:
-                audio = audio.reshape(-1, 1)
-                
-            return audio.astype(np.float32), elapsed
+            if written == len(buffer):
+                print(f"⚠ Recording truncated to {MAX_RECORDING_SECONDS}s")
+            # The audio itself stays in the buffer, where `live` transcribes it
+            return written, elapsed
             
     except Exception as e:
         print(f"Recording error: {e}")
-        return np.zeros((1, 1), dtype=np.float32), 0.0
+        return None
 
-def print_wrapped_response(llm, question: str, context: str, job_description: str, stop_generation: threading.Event):
-    """Print response with proper word wrapping"""
+def print_wrapped_response(llm, question: str, context: str, job_description: str, stop_generation: threading.Event, tokens=None):
+    """Print response with proper word wrapping. `tokens` is an already started stream to print instead"""
     
-    wrapper = WordWrapper(width=min(shutil.get_terminal_size().columns - 4, 100))
-    response_text = ""
+    wrapper = WordWrapper()
+    # Tokens are joined once at the end rather than appended to a growing string
+    response_parts = []
     word_count = 0
     
     try:
-        for token in llm.generate_response_stream(question, context, job_description):
+        if tokens is None:
+            tokens = llm.generate_response_stream(question, context, job_description)
+        for token in tokens:
             if stop_generation.is_set():
                 break
                 
@@ -351,8 +545,9 @@ def print_wrapped_response(llm, question: str, context: str, job_description: st
             if wrapped_output:
                 print(wrapped_output, end="", flush=True)
             
-            response_text += token
+            response_parts.append(token)
         
+        response_text = "".join(response_parts)
         if not stop_generation.is_set():
             final_output = wrapper.flush()
             if final_output:
@@ -372,78 +567,113 @@ def print_wrapped_response(llm, question: str, context: str, job_description: st
 
 def run_interview_session(device_pick, model, llm, context, job_description):
     """Interview loop with space interrupt"""
-    
     question_count = 0
+    transcriber = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+    keys = KeyReader()
+    keys.start()
     
     try:
         while True:
             question_count += 1
+            if not hasattr(signal, "SIGWINCH"):
+                refresh_response_width()
             
-            print(f"\n[Q{question_count}] Press ENTER to start recording...")
+            print(f"\n[Q{question_count}] Press SPACE or ENTER to start recording...")
+            keys.discard_pending()
             
+            # Whisper works through the recording while the question is being asked
+            live = LiveTranscriber(model, device_pick.samplerate)
             try:
-                audio, elapsed = record_manual_control(
+                recorded = record_manual_control(
                     device_pick.index, 
                     device_pick.samplerate, 
-                    device_pick.wasapi_loopback
+                    device_pick.wasapi_loopback,
+                    keys,
+                    live
                 )
                 
+                # A broken device fails again at once, so wait for a key instead of retrying in a loop
+                if recorded is None:
+                    live.stop()
+                    print("⚠ Recording failed, press SPACE or ENTER to try again")
+                    keys.wait()
+                    question_count -= 1
+                    continue
+                
+                captured, elapsed = recorded
                 if elapsed < 0.5:
+                    live.stop()
                     print("⚠ Too short, try again")
                     question_count -= 1
                     continue
+                
+                # Nothing was captured; don't spend a Whisper pass on silence
+                if not captured:
+                    live.stop()
+                    print("⚠ No audio captured, try again")
+                    question_count -= 1
+                    continue
                     
             except Exception as e:
+                live.stop()
                 print(f"⚠ Recording failed: {e}")
                 question_count -= 1
                 continue
 
             print("⚡ Transcribing...", end="", flush=True)
             transcribe_start = time.time()
-            text = transcribe_chunk(model, audio, device_pick.samplerate)
+            # Only the last window is left; SPACE can already interrupt while it runs
+            pending_text = transcriber.submit(live.finish)
+            
+            stop_generation = threading.Event()
+            keys.interrupt = stop_generation
+            
+            text = pending_text.result()
             transcribe_time = time.time() - transcribe_start
             print(f" done ({transcribe_time:.1f}s)")
             
             if not text or text == "(no speech detected)":
+                keys.interrupt = None
                 print("⚠ No speech detected")
                 question_count -= 1
                 continue
                 
-            print(f"\n🎤 QUESTION:")
-            print(textwrap.fill(text, width=min(shutil.get_terminal_size().columns - 4, 100)))
-            print(f"\n🤖 RESPONSE:")
-            print("-" * min(shutil.get_terminal_size().columns - 4, 100))
-            
-            stop_generation = threading.Event()
-            
-            def watch_for_space():
-                try:
-                    import msvcrt
-                    while not stop_generation.is_set():
-                        if msvcrt.kbhit():
-                            key = msvcrt.getch()
-                            if key == b' ':
-                                stop_generation.set()
-                                print("\n\n⏹ INTERRUPTED")
-                                return
-                        time.sleep(0.01)
-                except ImportError:
-                    pass
-
-            interrupt_thread = threading.Thread(target=watch_for_space, daemon=True)
-            interrupt_thread.start()
-            
-            response_text, word_count = print_wrapped_response(
-                llm, text, context, job_description, stop_generation
-            )
-            
-            if not stop_generation.is_set():
-                print(f"\n✓ Complete ({word_count} words)")
+            print("\n🎤 QUESTION:")
+            print(textwrap.fill(text, width=response_width))
+            # In practice mode every answer is generated at once, then shown in turn
+            if PRACTICE_ANSWERS > 1 and hasattr(llm, "generate_response_streams"):
+                streams = llm.generate_response_streams(
+                    text, context, job_description, PRACTICE_ANSWERS, stop=stop_generation
+                )
+            else:
+                streams = [None]
             
-            print("-" * min(shutil.get_terminal_size().columns - 4, 100))
+            try:
+                for i, tokens in enumerate(streams, 1):
+                    print(f"\n🤖 RESPONSE {i}/{len(streams)}:" if len(streams) > 1 else "\n🤖 RESPONSE:")
+                    print("-" * response_width)
+                    
+                    response_text, word_count = print_wrapped_response(
+                        llm, text, context, job_description, stop_generation, tokens
+                    )
+                    
+                    if not stop_generation.is_set():
+                        print(f"\n✓ Complete ({word_count} words)")
+                    
+                    print("-" * response_width)
+                    if stop_generation.is_set():
+                        break
+            finally:
+                # Practice answers still generating in the background stop once nobody reads them
+                stop_generation.set()
+            # SPACE toggles recording again from here on
+            keys.interrupt = None
 
     except KeyboardInterrupt:
         print(f"\n\nSession ended. Answered {question_count} questions.")
+    finally:
+        transcriber.shutdown(wait=False, cancel_futures=True)
+        keys.close()
 
 def main():
     try:
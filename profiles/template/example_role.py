@@ -0,0 +1,651 @@
+"""
+Example interview profile
+
+Copy this file to profiles/<your_name>/<your_role>.py and replace the
+placeholder background with your own. See profiles/README.md for details.
+"""
+import functools
+import hashlib
+import json
+import logging
+import os, queue, re, sys
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from io import StringIO
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# main.py and web_server.py already put src/core on the path; only add it when
+# the profile is imported on its own
+try:
+    from ollama_client import OllamaClient, encode_prompt_part
+except ImportError:
+    CORE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src', 'core'))
+    if CORE_DIR not in sys.path:
+        sys.path.insert(0, CORE_DIR)
+    from ollama_client import OllamaClient, encode_prompt_part
+
+logger = logging.getLogger(__name__)
+
+# Background data is read-only, so it lives at module level and is shared by
+# every profile instance instead of being rebuilt in __init__
+AGENTIC_AI_EXPERTISE = (
+    "Multi-agent systems with LangGraph and CrewAI",
+    "Tool-calling agents with planning and self-reflection loops",
+    "Agent evaluation harnesses and guardrails",
+)
+
+LLM_EXPERTISE = (
+    "Fine-tuning open models with LoRA/QLoRA",
+    "Prompt engineering and structured output with JSON schemas",
+    "LLM serving with vLLM and Ollama, including quantized models",
+)
+
+RAG_EXPERTISE = (
+    "Retrieval-augmented generation over 10M+ documents",
+    "Hybrid search with FAISS, pgvector and BM25 re-ranking",
+    "Chunking and embedding strategies for long technical documents",
+)
+
+MLOPS_EXPERTISE = (
+    "Containerized model deployment on Kubernetes (EKS, GKE)",
+    "CI/CD for ML with GitHub Actions, MLflow and model registries",
+    "Monitoring latency, cost and drift for production LLM services",
+)
+
+PROGRAMMING_LANGUAGES = (
+    "Python (FastAPI, Pandas, PyTorch)",
+    "TypeScript (React, Node.js)",
+    "SQL, Go, Bash",
+)
+
+WORK_EXPERIENCE = (
+    {
+        "role": "Senior GenAI Engineer",
+        "company": "Example Corp",
+        "location": "Remote",
+        "duration": "Jan 2022 - Present",
+        "key_projects": (
+            "Led a multi-agent support assistant resolving 40% of tickets without escalation",
+            "Built a RAG platform serving 2K+ internal users with sub-second retrieval",
+            "Cut LLM inference cost 55% by moving to quantized self-hosted models",
+        )
+    },
+    {
+        "role": "Machine Learning Engineer",
+        "company": "Sample Analytics",
+        "location": "Austin, TX",
+        "duration": "Jun 2018 - Dec 2021",
+        "key_projects": (
+            "Shipped NLP classification models processing 5M documents a day",
+            "Designed the feature store and training pipelines used by 4 teams",
+            "Reduced model deployment time from days to under an hour",
+        )
+    },
+)
+
+ACHIEVEMENTS = (
+    "Reduced answer latency of the support assistant from 8s to 1.5s",
+    "Raised RAG answer accuracy from 71% to 89% on the internal eval set",
+    "Mentored 5 engineers, two of whom were promoted to senior",
+)
+
+# Keyword sets per expertise area, matched against question/context tokens. Built
+# once at import and shared by every profile
+CATEGORY_KEYWORDS = {
+    "agentic": (
+        frozenset({"agent", "agents", "multi-agent", "agentic", "planning", "reasoning", "tool", "tools"}),
+        AGENTIC_AI_EXPERTISE
+    ),
+    "llm": (
+        frozenset({"llm", "llms", "gpt", "model", "models", "fine-tuning", "fine-tune", "prompt", "prompts"}),
+        LLM_EXPERTISE
+    ),
+    "rag": (
+        frozenset({"rag", "retrieval", "vector", "embedding", "embeddings", "search", "knowledge"}),
+        RAG_EXPERTISE
+    ),
+    "mlops": (
+        frozenset({"deploy", "deployment", "production", "kubernetes", "docker", "mlops", "monitoring", "scale"}),
+        MLOPS_EXPERTISE
+    ),
+    "programming": (
+        frozenset({"python", "code", "coding", "programming", "typescript", "sql", "api"}),
+        PROGRAMMING_LANGUAGES
+    ),
+}
+
+# Question categories in priority order; the first category with any phrase
+# in the question wins. Phrases match as plain substrings
+QUESTION_CATEGORIES = (
+    ("intro", ("tell me about yourself", "introduce", "background", "walk me through")),
+    ("challenge", ("technical challenge", "difficult problem", "hardest", "challenge")),
+    ("project", ("project", "built", "worked on")),
+    ("agentic", ("agent", "agentic", "multi-agent")),
+    ("rag", ("rag", "retrieval", "vector", "embedding")),
+    ("design", ("system design", "design a", "architecture", "scale")),
+    ("weakness", ("weakness", "failure", "mistake")),
+    ("motivation", ("why", "interested", "motivat")),
+)
+CATEGORY_RANK = {category: rank for rank, (category, _) in enumerate(QUESTION_CATEGORIES)}
+# One alternation with a named group per category, so the question is scanned once
+CATEGORY_REGEX = re.compile("|".join(
+    f"(?P<{category}>{'|'.join(map(re.escape, phrases))})"
+    for category, phrases in QUESTION_CATEGORIES
+))
+
+# Maximum number of expertise areas passed to the prompt
+EXPERTISE_LIMIT = 5
+
+# Answer structure to ask the model for, keyed by question category
+QUESTION_INSTRUCTIONS = {
+    "intro": (
+        "Provide a comprehensive professional summary covering:\n"
+        "- Your current role and years of experience\n"
+        "- Key technical skills and expertise areas\n"
+        "- Recent significant achievements\n"
+        "- What excites you about this opportunity\n"
+    ),
+    "challenge": (
+        "Use the STAR method:\n"
+        "- Situation: Context and background\n"
+        "- Task: What you needed to accomplish\n"
+        "- Action: Specific steps you took\n"
+        "- Result: Quantified outcome and impact\n"
+    ),
+    "project": (
+        "Describe one project in depth:\n"
+        "- The problem and why it mattered\n"
+        "- Architecture and your specific contributions\n"
+        "- Technologies used and trade-offs made\n"
+        "- Measurable results\n"
+    ),
+    "agentic": (
+        "Explain your agentic AI experience:\n"
+        "- Agent architecture (planning, tools, memory)\n"
+        "- Frameworks used and why\n"
+        "- How you evaluated and guarded agent behaviour\n"
+        "- Production results\n"
+    ),
+    "rag": (
+        "Explain your retrieval-augmented generation experience:\n"
+        "- Data ingestion and chunking strategy\n"
+        "- Retrieval and re-ranking approach\n"
+        "- How you measured answer quality\n"
+    ),
+    "design": (
+        "Walk through the design step by step:\n"
+        "- Requirements and constraints\n"
+        "- High-level components and data flow\n"
+        "- Scaling, reliability and cost trade-offs\n"
+    ),
+    "weakness": (
+        "Be honest and constructive:\n"
+        "- A real example\n"
+        "- What you learned\n"
+        "- What you do differently now\n"
+    ),
+    "motivation": (
+        "Connect your background to the role:\n"
+        "- What draws you to this company and team\n"
+        "- How your experience fits the job description\n"
+        "- What you want to achieve next\n"
+    ),
+    "default": "Answer directly with a specific example from your experience, in 4-6 sentences.\n",
+}
+
+# Canned answers for when the model is unavailable, keyed by question category.
+# Placeholders are filled from the profile with str.format_map
+FALLBACK_RESPONSES = {
+    "intro": (
+        "I'm {name}, a {role} with {years} years of experience "
+        "building machine learning and generative AI systems. Currently at "
+        "{company}, I lead work on multi-agent assistants and "
+        "retrieval-augmented generation platforms used by thousands of people every day. "
+        "Before that I spent several years at {previous_company} shipping NLP "
+        "models and the pipelines behind them. I enjoy taking ideas from prototype to "
+        "production, and I'm excited about this role because it combines applied research "
+        "with real product impact."
+    ),
+    "challenge": (
+        "One of the hardest problems I worked on at {company} was "
+        "latency in our support assistant. Answers were taking around eight seconds, which "
+        "users found frustrating. I profiled the pipeline, moved retrieval and generation to "
+        "run concurrently, cached embeddings and switched to a quantized self-hosted model. "
+        "That brought responses down to about 1.5 seconds and cut inference cost by more than half."
+    ),
+    "project": (
+        "A project I'm proud of is the RAG platform I built at {company}. "
+        "It indexes millions of internal documents with hybrid vector and keyword search, "
+        "re-ranks results and grounds every answer in citations. Over {years} "
+        "years I've learned that evaluation matters as much as modelling, so we built an eval "
+        "set early and used it to raise answer accuracy from 71% to 89%."
+    ),
+    "agentic": (
+        "I've built multi-agent systems with LangGraph and CrewAI where a planner agent breaks "
+        "a request into steps and specialised agents call tools to complete them. The key "
+        "lessons for me were keeping tool interfaces small, adding reflection steps, and "
+        "wrapping everything in evaluation and guardrails before it reaches users."
+    ),
+    "rag": (
+        "For retrieval-augmented generation I focus on the data first: clean ingestion, "
+        "chunking that respects document structure, and embeddings suited to the domain. "
+        "I combine vector search with BM25, re-rank the candidates, and measure both retrieval "
+        "recall and final answer quality so changes are driven by data."
+    ),
+    "design": (
+        "I'd start by clarifying requirements and expected load, then sketch the main components "
+        "and how data flows between them. From there I look at where state lives, how each part "
+        "scales horizontally, and what the latency and cost budgets are, and I call out the "
+        "trade-offs explicitly rather than hiding them."
+    ),
+    "weakness": (
+        "Early in my career I tended to optimise models before we had a good evaluation set, "
+        "which once meant shipping an improvement that didn't hold up in production. Since then "
+        "I insist on agreeing metrics and an eval set first, and it has made my work far more predictable."
+    ),
+    "motivation": (
+        "After {years} years building AI systems, I'm looking for a team where "
+        "generative AI is central to the product. This role matches what I've been doing, "
+        "agents, retrieval and production LLM services, and it's a chance to have a bigger impact."
+    ),
+    "default": (
+        "That's a good question. In my {years} years as an engineer I've approached "
+        "problems like this by starting from the user need, breaking it into measurable steps and "
+        "iterating quickly. At {company} that approach helped my team ship "
+        "reliable AI features while keeping latency and cost under control."
+    ),
+}
+
+# Generation limits by question category. Short answers get a smaller context
+# (less KV cache to allocate) and a lower token cap
+BASE_GENERATION_OPTIONS = {
+    "temperature": 0.3,
+    "top_p": 0.9,
+}
+
+GENERATION_OPTIONS = {
+    "intro": {**BASE_GENERATION_OPTIONS, "num_ctx": 2048, "num_predict": 400},
+    "challenge": {**BASE_GENERATION_OPTIONS, "num_ctx": 4096, "num_predict": 900},
+    "project": {**BASE_GENERATION_OPTIONS, "num_ctx": 4096, "num_predict": 900},
+    "design": {**BASE_GENERATION_OPTIONS, "num_ctx": 4096, "num_predict": 900},
+    "default": {**BASE_GENERATION_OPTIONS, "num_ctx": 2048, "num_predict": 500},
+}
+
+# Sampling temperature for practice answers, high enough that phrasings differ
+VARIANT_TEMPERATURE = 0.8
+
+# Model variants by free GPU memory (MB), largest first. The last tier is the
+# CPU / small-GPU default
+MODEL_TIERS = (
+    (24 * 1024, "llama3.1:8b-instruct-q8_0"),     # ~9GB, best quality
+    (12 * 1024, "llama3.1:8b-instruct-q4_K_M"),   # ~5GB, higher quality
+    (8 * 1024, "mistral:7b-instruct-q4_0"),       # ~4GB, general purpose
+    (0, "codellama:7b-instruct-q4_0"),            # ~4GB, good for coding interviews
+)
+
+# Answers already generated for a question, reused when practice repeats it.
+# Set RESPONSE_CACHE_SIZE=0 to always regenerate
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", "128"))
+RESPONSE_CACHE_PATH = Path(os.environ.get(
+    "RESPONSE_CACHE_FILE",
+    os.path.join(os.path.expanduser("~"), ".cache", "interview_assistant", "responses.json"),
+))
+
+def split_words(text: str) -> Tuple[str, ...]:
+    """Split text into space-terminated words that stream like model tokens"""
+    words = text.split(" ")
+    return tuple(f"{word} " for word in words[:-1]) + (words[-1],)
+
+@functools.lru_cache(maxsize=None)
+def pick_default_model() -> str:
+    """Largest model tier that fits in free GPU memory, probed once per process"""
+    free_mb = 0
+    if shutil.which("nvidia-smi"):
+        try:
+            result = subprocess.run(
+                ["nvidia-smi", "--query-gpu=memory.free", "--format=csv,noheader,nounits"],
+                capture_output=True,
+                timeout=5,
+                text=True
+            )
+            if result.returncode == 0:
+                free_mb = max((int(line) for line in result.stdout.split() if line.isdigit()), default=0)
+        except Exception as e:
+            logger.warning("[Profile] GPU probe failed: %.100s", e)
+    
+    for min_free_mb, model in MODEL_TIERS:
+        if free_mb >= min_free_mb:
+            return model
+    return MODEL_TIERS[-1][1]
+
+class InterviewProfile:
+    # Fixed attribute layout; add any new attribute you set in __init__ here
+    __slots__ = (
+        "name", "role", "experience_years", "phone", "email", "linkedin", "github",
+        "education", "agentic_ai_expertise", "llm_expertise", "rag_expertise",
+        "mlops_expertise", "programming_languages", "work_experience", "achievements",
+        "model", "_llm", "_prompt_preamble", "_prompt_preamble_bytes", "_prompt_answer_prefix", "_fallbacks", "_fallback_tokens",
+        "_cached_prompt", "_warmup_thread", "_job_description_section",
+    )
+    
+    # One client per model, shared by every profile, so Ollama isn't asked to
+    # reload a model another profile already has in memory
+    _CLIENT_CACHE: Dict[str, OllamaClient] = {}
+    _CLIENT_LOCK = threading.Lock()
+    
+    # Generated answers shared by every profile, loaded from disk on first use
+    _RESPONSE_CACHE: Optional[OrderedDict] = None
+    _RESPONSE_LOCK = threading.Lock()
+    
+    def __init__(self, model: str = None):
+        # Personal Information (REQUIRED)
+        self.name = "Jordan Smith"
+        self.role = "Senior GenAI Engineer"
+        self.experience_years = 6
+        self.phone = "+1 (555) 123-4567"
+        self.email = "jordan.smith@example.com"
+        self.linkedin = "linkedin.com/in/jordansmith"
+        self.github = "github.com/jordansmith"
+        
+        # Education
+        self.education = "M.S. Computer Science, Example University, 2018"
+        
+        # Technical Background (CUSTOMIZE the module-level constants above)
+        self.agentic_ai_expertise = AGENTIC_AI_EXPERTISE
+        self.llm_expertise = LLM_EXPERTISE
+        self.rag_expertise = RAG_EXPERTISE
+        self.mlops_expertise = MLOPS_EXPERTISE
+        self.programming_languages = PROGRAMMING_LANGUAGES
+        self.work_experience = WORK_EXPERIENCE
+        self.achievements = ACHIEVEMENTS
+        
+        # LLM Setup (REQUIRED); without an explicit model, pick a tier by free VRAM
+        self.model = model or os.environ.get("OLLAMA_MODEL") or pick_default_model()
+        self._llm = None
+        
+        # The prompt preamble only depends on the profile, so build it once
+        current_job = self.work_experience[0]
+        projects = "\n".join(f"- {p}" for p in current_job["key_projects"])
+        achievements = "\n".join(f"- {a}" for a in self.achievements)
+        self._prompt_preamble = (
+            f"You are {self.name}, a {self.role} with {self.experience_years} years of experience, "
+            "answering a question in a job interview. Speak in the first person, naturally and confidently.\n\n"
+            f"Current role: {current_job['role']} at {current_job['company']} ({current_job['duration']})\n"
+            f"Key projects:\n{projects}\n\n"
+            f"Achievements:\n{achievements}\n\n"
+            f"Education: {self.education}\n"
+            f"Languages: {', '.join(self.programming_languages)}\n"
+        )
+        self._prompt_preamble_bytes = encode_prompt_part(self._prompt_preamble)
+        self._prompt_answer_prefix = encode_prompt_part(f"{self.name}:")
+        # Fallback answers only depend on the profile too, so render them all up front
+        fallback_vars = {
+            "name": self.name,
+            "role": self.role,
+            "years": self.experience_years,
+            "company": self.work_experience[0]["company"],
+            "previous_company": self.work_experience[1]["company"],
+        }
+        self._fallbacks = {
+            category: template.format_map(fallback_vars)
+            for category, template in FALLBACK_RESPONSES.items()
+        }
+        # Pre-split into space-terminated words so a fallback streams like model output
+        self._fallback_tokens = {category: split_words(text) for category, text in self._fallbacks.items()}
+        
+        # Job description used when a call doesn't pass one; see set_job_description
+        self._job_description_section = ""
+        
+        # Prompts are deterministic per (question, context, job_description), and the
+        # same question is often re-asked on a retry or reconnect
+        self._cached_prompt = functools.lru_cache(maxsize=256)(self._build_interview_prompt)
+        
+        # Connect and load the model in the background so the first question
+        # doesn't pay the Ollama cold start
+        self._warmup_thread = threading.Thread(target=self._warm_up, name="ollama-warmup", daemon=True)
+        self._warmup_thread.start()
+        
+        logger.info("[Profile] Initialized for %s - %s using %s", self.name, self.role, self.model)
+    
+    @property
+    def llm(self) -> OllamaClient:
+        """Ollama client, created on first use since connecting can take seconds"""
+        if self._llm is None:
+            self._llm = type(self)._get_client(self.model)
+        return self._llm
+    
+    @classmethod
+    def _get_client(cls, model: str) -> OllamaClient:
+        """Shared client for model, created on first request"""
+        with cls._CLIENT_LOCK:
+            client = cls._CLIENT_CACHE.get(model)
+            if client is None:
+                client = cls._CLIENT_CACHE[model] = OllamaClient(model)
+            return client
+    
+    def _response_key(self, question: str, context: str, job_description: Optional[str]) -> str:
+        """Cache key for an answer: the profile, model, question and the context it was given"""
+        if job_description is None:
+            jd_section = self._job_description_section
+        else:
+            jd_section = self._format_job_description(job_description)
+        key = "\0".join((self.name, self.model, question.strip().lower(), context, jd_section))
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @classmethod
+    def _cached_response(cls, key: str) -> Optional[str]:
+        """Previously generated answer for key, if any"""
+        with cls._RESPONSE_LOCK:
+            if cls._RESPONSE_CACHE is None:
+                cls._RESPONSE_CACHE = OrderedDict()
+                try:
+                    with open(RESPONSE_CACHE_PATH, encoding="utf-8") as f:
+                        cls._RESPONSE_CACHE.update(json.load(f))
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning("[Profile] Ignoring unreadable response cache: %.100s", e)
+            
+            response = cls._RESPONSE_CACHE.get(key)
+            if response is not None:
+                cls._RESPONSE_CACHE.move_to_end(key)
+            return response
+    
+    @classmethod
+    def _cache_response(cls, key: str, response: str):
+        """Store a generated answer, evicting the oldest, and persist the cache"""
+        with cls._RESPONSE_LOCK:
+            cls._RESPONSE_CACHE[key] = response
+            while len(cls._RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+                cls._RESPONSE_CACHE.popitem(last=False)
+            
+            try:
+                RESPONSE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = RESPONSE_CACHE_PATH.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(cls._RESPONSE_CACHE, f)
+                os.replace(tmp_path, RESPONSE_CACHE_PATH)
+            except Exception as e:
+                logger.warning("[Profile] Could not save response cache: %.100s", e)
+    
+    def _warm_up(self):
+        """Create the client and preload the model into memory"""
+        try:
+            self.llm.warm_up()
+        except Exception as e:
+            logger.warning("[Profile] Warmup failed: %.100s", e)
+    
+    def set_job_description(self, job_description: str):
+        """Store the session's job description so prompts don't need it passed per call"""
+        self._job_description_section = self._format_job_description(job_description)
+        self._cached_prompt.cache_clear()
+    
+    @staticmethod
+    def _format_job_description(job_description: str) -> str:
+        """Prompt section for a job description, or "" if it's too short to be useful"""
+        if job_description and len(job_description) > 50:
+            return f"\nTarget role (job description excerpt):\n{job_description[:300]}...\n"
+        return ""
+    
+    def generate_stream(self, question: str, context: str = "", job_description: Optional[str] = None):
+        """Required method for streaming responses"""
+        return self.generate_response_stream(question, context, job_description)
+    
+    def generate_response_stream(self, question: str, context: str = "", job_description: Optional[str] = None):
+        """Generate streaming interview responses"""
+        if RESPONSE_CACHE_SIZE > 0:
+            cache_key = self._response_key(question, context, job_description)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                yield from split_words(cached)
+                return
+        
+        prompt = self._cached_prompt(question, context, job_description)
+        category = self._question_category(question.lower())
+        fallback = self._get_comprehensive_fallback(category)
+        options = GENERATION_OPTIONS.get(category, GENERATION_OPTIONS["default"])
+        
+        # Let the warmup finish connecting before generating
+        self._warmup_thread.join()
+        
+        tokens = []
+        stream = self.llm.generate_stream(prompt, options, fallback)
+        while True:
+            try:
+                token = next(stream)
+            except StopIteration as end:
+                # The client returns True only once the model reported the answer done
+                completed = end.value is True
+                break
+            if token is fallback:
+                # The client hands the fallback back in one piece; stream it word by word
+                yield from self._fallback_tokens.get(category, self._fallback_tokens["default"])
+            else:
+                tokens.append(token)
+                yield token
+        
+        # Only complete model answers are cached, never a truncated one or the fallback
+        if RESPONSE_CACHE_SIZE > 0 and tokens and completed:
+            self._cache_response(cache_key, "".join(tokens))
+    
+    def generate_response_streams(self, question: str, context: str = "", job_description: Optional[str] = None,
+                                  n: int = 3, stop: Optional[threading.Event] = None) -> List[Iterator[str]]:
+        """Start n differently seeded answers at once (practice mode) and return a token stream for each.
+        They share one prompt, so Ollama reuses the cached prefix and batches the
+        decoding, up to OLLAMA_NUM_PARALLEL requests on the server. Set `stop` once
+        the streams are no longer read, so unfinished answers stop generating"""
+        stop = stop or threading.Event()
+        prompt = self._cached_prompt(question, context, job_description)
+        category = self._question_category(question.lower())
+        fallback = self._get_comprehensive_fallback(category)
+        options = {**GENERATION_OPTIONS.get(category, GENERATION_OPTIONS["default"]), "temperature": VARIANT_TEMPERATURE}
+        
+        self._warmup_thread.join()
+        if not self.llm.working:
+            n = 1  # Every variant would be the same fallback
+        
+        streams = []
+        for seed in range(n):
+            tokens = queue.SimpleQueue()
+            threading.Thread(
+                target=self._fill_stream,
+                args=(tokens, prompt, {**options, "seed": seed}, fallback, category, stop),
+                daemon=True,
+            ).start()
+            streams.append(iter(tokens.get, None))
+        return streams
+    
+    def _fill_stream(self, tokens: queue.SimpleQueue, prompt: Tuple[bytes, ...], options: Dict, fallback: str,
+                     category: str, stop: threading.Event):
+        """Generate one practice answer into `tokens`, ending it with None; gives up once `stop` is set"""
+        stream = self.llm.generate_stream(prompt, options, fallback)
+        try:
+            for token in stream:
+                if stop.is_set():
+                    break
+                if token is fallback:
+                    for word in self._fallback_tokens.get(category, self._fallback_tokens["default"]):
+                        tokens.put(word)
+                else:
+                    tokens.put(token)
+        finally:
+            # Closing the generator closes its request
+            stream.close()
+            tokens.put(None)
+    
+    def generate_response(self, question: str, context: str = "", job_description: Optional[str] = None) -> str:
+        """Generate a complete (non-streaming) interview response"""
+        buf = StringIO()
+        write = buf.write
+        for token in self.generate_response_stream(question, context, job_description):
+            write(token)
+        return buf.getvalue()
+    
+    def _extract_relevant_expertise(self, q_lower: str, ctx_lower: str = "") -> List[str]:
+        """Pick the expertise areas the lowercased question or context touches on"""
+        # Tokenize once; each category is then a hashed set lookup, not a substring scan
+        tokens = frozenset(re.findall(r"[a-z0-9\-]+", f"{q_lower} {ctx_lower}"))
+        
+        relevant = []
+        for keywords, expertise in CATEGORY_KEYWORDS.values():
+            if not keywords.isdisjoint(tokens):
+                relevant.extend(expertise)
+        
+        return relevant[:EXPERTISE_LIMIT]
+    
+    def _build_interview_prompt(self, question: str, context: str = "", job_description: Optional[str] = None) -> Tuple[bytes, ...]:
+        """Build the full prompt sent to the model, as pre-escaped parts for OllamaClient.generate_stream"""
+        # Lowercase once and share it with every helper
+        q_lower = question.lower()
+        ctx_lower = context.lower() if context else ""
+        relevant_expertise = self._extract_relevant_expertise(q_lower, ctx_lower)
+        instructions = self._get_detailed_question_instructions(q_lower)
+        
+        # Everything that stays the same for a session comes first, so successive
+        # questions share a prompt prefix and Ollama can reuse its KV cache for it
+        if job_description is None:
+            session = self._job_description_section
+        else:
+            session = self._format_job_description(job_description)
+        if context:
+            session += f"\nAdditional context:\n{context}\n"
+        
+        # Only the question-dependent tail changes between calls
+        tail = ""
+        if relevant_expertise:
+            tail = f"\nMost relevant expertise: {', '.join(relevant_expertise[:3])}\n"
+        tail += f"\n{instructions}\nInterviewer: {question}\n"
+        
+        return (
+            self._prompt_preamble_bytes,
+            encode_prompt_part(session),
+            encode_prompt_part(tail),
+            self._prompt_answer_prefix,
+        )
+    
+    def _question_category(self, q_lower: str) -> Optional[str]:
+        """Highest-priority question category whose phrases appear in q_lower, if any"""
+        best = None
+        for match in CATEGORY_REGEX.finditer(q_lower):
+            rank = CATEGORY_RANK[match.lastgroup]
+            if best is None or rank < best:
+                best = rank
+                if rank == 0:
+                    break
+        return QUESTION_CATEGORIES[best][0] if best is not None else None
+    
+    def _get_detailed_question_instructions(self, q_lower: str) -> str:
+        """Answer structure to ask for, by question type"""
+        category = self._question_category(q_lower)
+        return QUESTION_INSTRUCTIONS.get(category, QUESTION_INSTRUCTIONS["default"])
+    
+    def _get_comprehensive_fallback(self, category: Optional[str]) -> str:
+        """Canned answer used when the model is unavailable"""
+        return self._fallbacks.get(category, self._fallbacks["default"])
+
+def make_llm():
+    """Required factory function"""
+    return InterviewProfile()
\ No newline at end of file
@@ -152,19 +152,27 @@ def record_until_enter(
     # Concatenate all audio frames
     chunk = np.concatenate(frames, axis=0)  # shape (N, channels)
     
-    # Convert to mono if needed
+    # Convert to mono if needed, reducing straight into the output buffer
     if chunk.ndim == 2 and chunk.shape[1] > 1:
-        chunk = np.mean(chunk, axis=1, keepdims=True)
+        mono = np.empty((chunk.shape[0], 1), dtype=np.float32)
+        np.mean(chunk, axis=1, keepdims=True, out=mono)
+        chunk = mono
     elif chunk.ndim == 1:
         chunk = chunk.reshape(-1, 1)
         
-    return chunk.astype(np.float32), elapsed
+    return chunk.astype(np.float32, copy=False), elapsed
 
 
-def transcribe_chunk(model: WhisperModel, audio_mono: np.ndarray, input_rate: int) -> str:
+def transcribe_chunk(
+    model: WhisperModel,
+    audio_mono: np.ndarray,
+    input_rate: int,
+    initial_prompt: Optional[str] = None,
+) -> str:
     """
     Transcribe audio chunk with proper preprocessing.
     Optimized for speed with faster settings.
+    initial_prompt carries earlier text when a recording is transcribed in pieces.
     """
     # Ensure we have the right shape
     if audio_mono.ndim == 2:
@@ -202,6 +210,8 @@ def transcribe_chunk(model: WhisperModel, audio_mono: np.ndarray, input_rate: in
             temperature=0.0,
             beam_size=1,      # Faster (was 5)
             best_of=1,        # Faster (was 5)
+            initial_prompt=initial_prompt,
+            condition_on_previous_text=True,
             vad_filter=True,  # Skip non-speech parts
             vad_parameters=dict(
                 threshold=0.5,
@@ -5,16 +5,39 @@ Fast, reliable connection with intelligent fallback handling
 import os
 import json
 import requests
-from typing import Generator, Optional, Dict, Any
+from json.encoder import encode_basestring_ascii
+from typing import Generator, Optional, Dict, Any, Sequence, Union
 import time
 
 DEFAULT_OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434").rstrip("/")
 
+# How long the server keeps the model loaded after a request; -1 keeps it resident
+# so there is no cold start between interview questions
+_keep_alive = os.environ.get("OLLAMA_KEEP_ALIVE", "-1")
+KEEP_ALIVE = int(_keep_alive) if _keep_alive.lstrip("-").isdigit() else _keep_alive
+
+# Shared keep-alive session so the tags check, test generation and every
+# streamed answer reuse one TCP connection to the Ollama server
+SESSION = requests.Session()
+SESSION.headers.update({"Connection": "keep-alive"})
+
+# The server's model list, kept on disk for a minute so a restart skips the round trip
+MODELS_CACHE_PATH = os.environ.get(
+    "MODELS_CACHE_FILE",
+    os.path.join(os.path.expanduser("~"), ".cache", "interview_assistant", "models.json"),
+)
+MODELS_CACHE_TTL = 60
+
+def encode_prompt_part(text: str) -> bytes:
+    """JSON-escape a piece of prompt text so generate_stream can splice it into the request as-is"""
+    return encode_basestring_ascii(text)[1:-1].encode("ascii")
+
 class OllamaClient:
     """Optimized Ollama client for fast interview responses"""
     
-    def __init__(self, model: str, base_url: str = DEFAULT_OLLAMA_URL):
+    def __init__(self, model: str, base_url: str = DEFAULT_OLLAMA_URL, session: Optional[requests.Session] = None):
         self.base_url = base_url
+        self.session = session or SESSION
         self.model = model
         self.working = False
         self.connection_attempts = 0
@@ -35,17 +58,54 @@ class OllamaClient:
         else:
             print(f"✗ [LLM] Ollama not available - using fallback responses")
 
+    def _get_models(self, require: Optional[str] = None) -> Optional[list]:
+        """
+        Model entries from /api/tags, or None if the server answered with an error.
+        A fresh on-disk copy is used instead when it lists `require`; a stale one
+        only if the server can't be reached.
+        """
+        cached = None
+        try:
+            with open(MODELS_CACHE_PATH, encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("base_url") != self.base_url:
+                cached = None
+            elif (time.time() - os.path.getmtime(MODELS_CACHE_PATH) < MODELS_CACHE_TTL
+                  and (require is None or any(m.get("name") == require for m in cached["models"]))):
+                return cached["models"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            cached = None
+        
+        try:
+            # Check server with short timeout
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=3)
+        except requests.exceptions.RequestException:
+            if cached is not None:
+                return cached["models"]
+            raise
+        if response.status_code != 200:
+            print(f"[LLM] Server returned status {response.status_code}")
+            return None
+        
+        models = response.json().get("models", [])
+        try:
+            os.makedirs(os.path.dirname(MODELS_CACHE_PATH), exist_ok=True)
+            tmp_path = MODELS_CACHE_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"base_url": self.base_url, "models": models}, f)
+            os.replace(tmp_path, MODELS_CACHE_PATH)
+        except OSError:
+            pass
+        return models
+
     def _test_connection(self) -> bool:
         """Test if Ollama server and model are available"""
         try:
-            # Check server with short timeout
-            response = requests.get(f"{self.base_url}/api/tags", timeout=3)
-            if response.status_code != 200:
-                print(f"[LLM] Server returned status {response.status_code}")
+            models_data = self._get_models(require=self.model)
+            if models_data is None:
                 return False
             
             # Check model availability
-            models_data = response.json().get("models", [])
             available_models = [m.get("name", "") for m in models_data]
             
             # Debug: show what we're looking for vs what's available
@@ -62,7 +122,7 @@ class OllamaClient:
                     return False
             
             # Quick generation test with minimal tokens
-            test_response = requests.post(
+            test_response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
@@ -107,22 +167,26 @@ class OllamaClient:
             return False
 
     def generate_stream(self, 
-                       prompt: str, 
+                       prompt: Union[str, Sequence[bytes]], 
                        options: Optional[Dict[str, Any]] = None,
-                       fallback_response: Optional[str] = None) -> Generator[str, None, None]:
+                       fallback_response: Optional[str] = None) -> Generator[str, None, bool]:
         """
         Generate streaming response from Ollama with optimized settings
         
         Args:
-            prompt: The prompt to send to the model
+            prompt: The prompt to send to the model, or its parts pre-escaped with encode_prompt_part
             options: Ollama generation options (temperature, num_predict, etc.)
             fallback_response: Response to return if generation fails
+        
+        Returns:
+            As the generator's return value, True only if the model reported the
+            answer done; False if it was cut short or the fallback was used
         """
         if not self.working:
             print("[LLM] ⚠ Ollama not available - using fallback")
             if fallback_response:
                 yield fallback_response
-            return
+            return False
         
         # OPTIMIZED defaults for SPEED
         default_options = {
@@ -139,18 +203,28 @@ class OllamaClient:
         if options:
             default_options.update(options)
         
+        response = None
         try:
             print(f"[LLM] ⚡ Generating with {self.model}...")
             start_time = time.time()
             
-            response = requests.post(
+            payload = {
+                "model": self.model,
+                "stream": True,
+                "keep_alive": KEEP_ALIVE,
+                "options": default_options
+            }
+            if isinstance(prompt, str):
+                payload["prompt"] = prompt
+                body = {"json": payload}
+            else:
+                # Pre-escaped parts go straight into the body without re-encoding the prompt
+                data = b'{"prompt": "' + b"".join(prompt) + b'", ' + json.dumps(payload)[1:].encode("ascii")
+                body = {"data": data, "headers": {"Content-Type": "application/json"}}
+            
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": True,
-                    "options": default_options
-                },
+                **body,
                 stream=True,
                 timeout=45  # Shorter timeout for faster failure
             )
@@ -166,17 +240,18 @@ class OllamaClient:
                 
                 if fallback_response:
                     yield fallback_response
-                return
+                return False
                 
             elif response.status_code != 200:
                 print(f"[LLM] ✗ HTTP {response.status_code}")
                 if fallback_response:
                     yield fallback_response
-                return
+                return False
             
             # Stream response tokens
             token_count = 0
             first_token_time = None
+            completed = False
             
             for line in response.iter_lines():
                 if line:
@@ -188,7 +263,7 @@ class OllamaClient:
                             print(f"[LLM] ✗ API error: {data['error']}")
                             if token_count == 0 and fallback_response:
                                 yield fallback_response
-                            return
+                            return False
                         
                         # Yield tokens
                         if 'response' in data and data['response']:
@@ -205,7 +280,8 @@ class OllamaClient:
                             total_time = time.time() - start_time
                             tokens_per_sec = token_count / total_time if total_time > 0 else 0
                             print(f"[LLM] ✓ Complete: {token_count} tokens in {total_time:.2f}s ({tokens_per_sec:.1f} t/s)")
-                            return
+                            # Read on to the end of the body so the session can reuse the connection
+                            completed = True
                             
                     except json.JSONDecodeError:
                         continue
@@ -213,6 +289,9 @@ class OllamaClient:
                         print(f"[LLM] ⚠ Stream error: {str(e)[:100]}")
                         continue
             
+            if completed:
+                return True
+            
             # No tokens received - use fallback
             if token_count == 0:
                 print("[LLM] ✗ No response tokens received")
@@ -232,6 +311,12 @@ class OllamaClient:
             print(f"[LLM] ✗ Generation failed: {str(e)[:100]}")
             if fallback_response:
                 yield fallback_response
+        finally:
+            # Also runs when the caller closes the generator early; dropping an
+            # unfinished stream's connection makes Ollama stop generating it
+            if response is not None:
+                response.close()
+        return False
 
     def generate_simple(self, prompt: str, max_tokens: int = 100) -> str:
         """Generate a simple non-streaming response"""
@@ -239,7 +324,7 @@ class OllamaClient:
             return "LLM not available"
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
@@ -263,21 +348,22 @@ class OllamaClient:
             return f"Generation failed: {str(e)[:100]}"
 
     def warm_up(self):
-        """Pre-warm the model by running a quick generation"""
+        """Pre-warm the model so the first real question skips the model load"""
         if not self.working:
             return False
         
         print(f"[LLM] 🔥 Warming up {self.model}...")
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
-                    "prompt": "Hello",
+                    "prompt": "",  # An empty prompt only loads the model into memory
                     "stream": False,
-                    "options": {"num_predict": 5}
+                    "keep_alive": KEEP_ALIVE,
+                    "options": {"num_predict": 1}
                 },
-                timeout=10
+                timeout=60  # Cold loads can take 30s+
             )
             
             if response.status_code == 200:
@@ -304,7 +390,7 @@ class OllamaClient:
             }
         
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=3)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=3)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 for model in models:
@@ -331,9 +417,8 @@ class OllamaClient:
     def list_available_models(self) -> list:
         """List all available models"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=3)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
+            models = self._get_models()
+            if models is not None:
                 return [
                     {
                         "name": m.get("name"),
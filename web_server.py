@@ -51,9 +51,22 @@ def load_profile_module(user, role_file):
     if not profile_path.exists():
         raise FileNotFoundError(f"Profile not found: {profile_path}")
     
-    spec = importlib.util.spec_from_file_location("selected_profile", profile_path)
+    # Reuse the already-executed module unless the profile file has changed
+    module_name = f"profile_{user}_{role_file}"
+    mtime = profile_path.stat().st_mtime_ns
+    cached = sys.modules.get(module_name)
+    if cached is not None and getattr(cached, "__profile_mtime__", None) == mtime:
+        return cached
+    
+    spec = importlib.util.spec_from_file_location(module_name, profile_path)
     profile_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(profile_module)
+    profile_module.__profile_mtime__ = mtime
+    sys.modules[module_name] = profile_module
+    try:
+        spec.loader.exec_module(profile_module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
     
     return profile_module
 
@@ -68,8 +81,18 @@ def load_role_job_description(user, role_file):
         "jd.txt"
     ]
     
+    # List each candidate directory once instead of stat-ing every path
+    listings = {}
     for path in possible_paths:
-        if os.path.exists(path):
+        directory, name = os.path.split(path)
+        if directory not in listings:
+            try:
+                with os.scandir(directory or ".") as entries:
+                    listings[directory] = {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+            except OSError:
+                listings[directory] = set()
+        
+        if os.path.normcase(name) in listings[directory]:
             try:
                 with open(path, "r", encoding="utf-8") as f:
                     return f.read().strip()
@@ -103,16 +126,20 @@ def get_profiles():
         return jsonify({"error": "No profiles directory found"}), 404
     
     users = []
-    for user_dir in profiles_dir.iterdir():
-        if user_dir.is_dir() and not user_dir.name.startswith('.') and not user_dir.name.startswith('__'):
+    # scandir answers is_dir()/is_file() from the directory listing, without a stat per entry
+    with os.scandir(profiles_dir) as user_dirs:
+        for user_dir in user_dirs:
+            if not user_dir.is_dir() or user_dir.name.startswith('.') or user_dir.name.startswith('__'):
+                continue
             roles = []
-            for role_file in user_dir.iterdir():
-                if role_file.is_file() and role_file.suffix == '.py' and not role_file.name.startswith('__'):
-                    role_name = role_file.stem.replace('_', ' ').title()
-                    roles.append({
-                        'file': role_file.stem,
-                        'display': role_name
-                    })
+            with os.scandir(user_dir.path) as role_files:
+                for role_file in role_files:
+                    if role_file.is_file() and role_file.name.endswith('.py') and not role_file.name.startswith('__'):
+                        stem = role_file.name[:-3]
+                        roles.append({
+                            'file': stem,
+                            'display': stem.replace('_', ' ').title()
+                        })
             
             if roles:
                 users.append({
@@ -232,12 +259,14 @@ def stop_recording():
         # Process audio
         audio = np.concatenate(state.audio_frames, axis=0)
         if audio.ndim == 2 and audio.shape[1] > 1:
-            audio = np.mean(audio, axis=1, keepdims=True)
+            mono = np.empty((audio.shape[0], 1), dtype=np.float32)
+            np.mean(audio, axis=1, keepdims=True, out=mono)
+            audio = mono
         elif audio.ndim == 1:
             audio = audio.reshape(-1, 1)
         
         # Transcribe
-        text = transcribe_chunk(state.model, audio.astype(np.float32), state.device_pick.samplerate)
+        text = transcribe_chunk(state.model, audio.astype(np.float32, copy=False), state.device_pick.samplerate)
         
         if not text or text == "(no speech detected)":
             return jsonify({"error": "No speech detected"}), 400